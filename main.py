@@ -1,9 +1,10 @@
 import logging
 import time
+from collections import deque
 import streamlit as st
 from dotenv import load_dotenv
-from src.backend import PlayManager
-from typing import List, Tuple, Generator
+from src.backend import PlayManager, ResponseStream
+from typing import Iterable, Tuple, Generator, Union
 
 from src.frontend import *
 
@@ -11,16 +12,29 @@ load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Number of most recent messages shown outside the "Earlier" expander
+VISIBLE_WINDOW = 50
+
+# Number of most recent errors kept for the "Debug Information" expander
+ERROR_LOG_SIZE = 50
+
 def init_session_state() -> None:
     """Initialize session state variables"""
     if 'play_manager' not in st.session_state:
         st.session_state.play_manager = PlayManager()
-    if 'messages' not in st.session_state:
-        st.session_state.messages = []
+    if 'msg_roles' not in st.session_state:
+        # Message history is kept as parallel lists of roles, avatars and formatted markdown
+        st.session_state.msg_roles = []
+        st.session_state.msg_avatars = []
+        st.session_state.msg_html = []
+    if 'avatar_cache' not in st.session_state:
+        st.session_state.avatar_cache = {}
+    if 'trait_label_cache' not in st.session_state:
+        st.session_state.trait_label_cache = {}
     if 'started' not in st.session_state:
         st.session_state.started = False
     if 'error_log' not in st.session_state:
-        st.session_state.error_log = []
+        st.session_state.error_log = deque(maxlen=ERROR_LOG_SIZE)
     if 'user_name' not in st.session_state:
         st.session_state.user_name = "Anonymous Player"
     if 'user_description' not in st.session_state:
@@ -28,14 +42,71 @@ def init_session_state() -> None:
     if 'info_saved' not in st.session_state:
         st.session_state.info_saved = False
 
-def process_responses(responses: List[str]) -> Generator[Tuple[str, str], None, None]:
-    """Process responses and yield messages to add"""
+def process_responses(responses: Iterable[Union[str, ResponseStream]]
+                      ) -> Generator[Tuple[str, Union[str, float, ResponseStream]], None, None]:
+    """Process responses and yield messages to add.
+    
+    "PAUSE:<seconds>" directives are yielded as ("pause", seconds) instead of
+    sleeping here, so the caller decides whether to honor them. Streamed
+    responses are yielded as ("stream", stream).
+    """
     for response in responses:
-        if response.startswith("PAUSE:"):
-            time.sleep(float(response.split(":")[1]))
+        if isinstance(response, ResponseStream):
+            yield ("stream", response)
+            continue
+        if response[:6] == "PAUSE:":
+            yield ("pause", float(response[6:]))
             continue
         yield ("assistant", response)
 
+@st.fragment
+def display_chat() -> None:
+    """Display the message history and handle chat input.
+    
+    Runs as a fragment so submitting a message only reruns the chat pane
+    instead of redrawing the title, sidebar and styles as well.
+    """
+    # Display message history, folding older messages into an expander
+    history = list(zip(st.session_state.msg_roles,
+                       st.session_state.msg_avatars,
+                       st.session_state.msg_html))
+    hidden = len(history) - VISIBLE_WINDOW
+    if hidden > 0:
+        earlier = st.expander(f"Earlier ({hidden} messages)", key="earlier_messages",
+                              on_change="rerun")
+        # Collapsed expanders send nothing; opening one reruns the fragment to fill it
+        if earlier.open:
+            with earlier:
+                display_history(history[:hidden])
+    display_history(history[max(hidden, 0):])
+    
+    # The scene's first character response is still being generated in the background
+    pending = st.session_state.get('pending_initial_response')
+    if pending is not None:
+        with st.spinner("The characters are settling in..."):
+            initial_char_response = pending.result()
+        del st.session_state.pending_initial_response
+        display_formatted_message("assistant", *add_message("assistant", initial_char_response))
+    
+    # Chat input
+    if prompt := st.chat_input("Your response"):
+        display_formatted_message("user", *add_message("user", prompt))
+        
+        message_container = st.container()
+        responses = st.session_state.play_manager.process_input(prompt)
+        
+        for role, content in process_responses(responses):
+            if role == "pause":
+                time.sleep(content)
+                continue
+            if role == "stream":
+                with message_container:
+                    display_stream(content)
+                add_message("assistant", content.content)
+                continue
+            with message_container:
+                display_formatted_message(role, *add_message(role, content))
+
 def main() -> None:
     """Main application entry point"""
     setup_page_config()
@@ -53,25 +124,7 @@ def main() -> None:
             display_scenario_buttons()
     
     else:
-        # Display message history
-        for role, content in st.session_state.messages:
-            display_message(role, content)
-        
-        # Chat input
-        if prompt := st.chat_input("Your response"):
-            display_message("user", prompt)
-            st.session_state.messages.append(("user", prompt))
-            
-            message_container = st.container()
-            responses = st.session_state.play_manager.process_input(prompt)
-            
-            for role, content in process_responses(responses):
-                with message_container:
-                    display_message(role, content)
-                st.session_state.messages.append((role, content))
-                time.sleep(0.1)
-            
-            st.rerun()
+        display_chat()
     
     # Display custom form at the end if needed
     if st.session_state.get('show_custom_form', False):
@@ -1,3 +1,4 @@
 from .play_manager import PlayManager
+from .agents import ResponseStream
 
-__all__ = ["PlayManager"]
\ No newline at end of file
+__all__ = ["PlayManager", "ResponseStream"]
\ No newline at end of file
@@ -1,9 +1,9 @@
 from .character import Character
 from .narrator import Narrator
 from .orchestrator import Orchestrator
-from .response_processor import ResponseProcessor
+from .response_processor import ResponseProcessor, ResponseStream
 from ..utils import clean_json_response
-from .game_log import GameLog
+from .game_log import BufferedGameLog, GameLog
 from .prompts import *
 
-__all__ = ["Character", "Narrator", "Orchestrator", "ResponseProcessor", "clean_json_response", "GameLog", "CHARACTER_RESPONSE_PROMPT", "NARRATOR_OBSERVATION_PROMPT"]
\ No newline at end of file
+__all__ = ["Character", "Narrator", "Orchestrator", "ResponseProcessor", "ResponseStream", "clean_json_response", "GameLog", "BufferedGameLog", "CHARACTER_RESPONSE_PROMPT", "NARRATOR_OBSERVATION_PROMPT"]
\ No newline at end of file
@@ -1,9 +1,8 @@
 import logging
-import os
 from langchain_groq import ChatGroq
-from typing import Dict, Optional, Any
-from queue import Empty
+from typing import Dict, Optional, Any, Generator
 
+from .llm_pool import get_llm
 from .memory import MemoryManager, MemoryEvent
 from .prompts import CHARACTER_RESPONSE_PROMPT
 from ..schema import CharacterConfig
@@ -17,9 +16,9 @@ class Character:
     Attributes:
         config (CharacterConfig): Configuration object containing character attributes
         memory (MemoryManager): Manager for character's memory and interaction history
-        thoughts_queue (Optional[Queue]): Queue for pre-generated character thoughts
+        orchestrator (Optional[Any]): Orchestrator holding the pre-generated character thoughts
         llm (ChatGroq): Language model for generating responses
-        chain (Chain): Prompt chain for character responses
+        chain (Chain): Prompt chain for character responses, with the persona already filled in
         user_name (str): Name of the user interacting with the character
         user_description (str): Description of the user
     """
@@ -33,9 +32,11 @@ class Character:
         """
         self.config = config
         self.memory = MemoryManager(max_memories=10)
-        self.thoughts_queue = None
+        self.orchestrator = None
         self.llm = self._initialize_llm()
-        self.chain = CHARACTER_RESPONSE_PROMPT | self.llm
+        
+        # The persona part of the system prompt never changes, so bind it once
+        self.chain = CHARACTER_RESPONSE_PROMPT.partial(**self._persona_inputs()) | self.llm
     
     @property
     def name(self) -> str:
@@ -95,15 +96,12 @@ class Character:
         return self.config.gender
     
     def _initialize_llm(self) -> ChatGroq:
-        """Initialize the language model for generating responses.
+        """Get the shared language model for generating responses.
         
         Returns:
             ChatGroq: Configured language model instance
         """
-        return ChatGroq(
-            api_key=os.getenv("GROQ_API_KEY"),
-            model_name=os.getenv("CHARACTER_MODEL"),
-        )
+        return get_llm("character")
     
     def _format_personality(self) -> str:
         """Format personality traits into a readable string.
@@ -115,13 +113,28 @@ class Character:
             f"{k} ({v:.1f})" for k, v in self.personality.items()
         )
     
+    def _persona_inputs(self) -> Dict[str, str]:
+        """Build the prompt variables describing who the character is.
+        
+        Returns:
+            Dict[str, str]: Name, personality, gender, background and hidden motive
+                variables for CHARACTER_RESPONSE_PROMPT
+        """
+        return {
+            "name": self.name,
+            "personality": self._format_personality(),
+            "gender": self.gender,
+            "background": self.background,
+            "hidden_motive": self.hidden_motive
+        }
+    
     def set_orchestrator(self, orchestrator: Any) -> None:
         """Set reference to orchestrator for accessing shared resources.
         
         Args:
             orchestrator (Any): The orchestrator object managing the conversation
         """
-        self.thoughts_queue = orchestrator.thoughts_queue
+        self.orchestrator = orchestrator
     
     def get_current_thought(self) -> Optional[str]:
         """Get a pre-generated thought if available.
@@ -129,26 +142,11 @@ class Character:
         Returns:
             Optional[str]: The current thought if available for this character, None otherwise
         """
-        if not self.thoughts_queue:
+        if not self.orchestrator:
             return None
         
-        try:
-            # Check multiple items in queue to find a thought for this character
-            for _ in range(self.thoughts_queue.qsize()):
-                char_name, thought = self.thoughts_queue.get_nowait()
-                
-                # If thought is for this character, return it
-                if char_name == self.name:
-                    return thought
-                    
-                # Put back thoughts for other characters
-                self.thoughts_queue.put((char_name, thought))
-                
-            # If we didn't find a thought for this character after checking queue
-            return None
-            
-        except Empty:
-            return None
+        next_thought = self.orchestrator.get_next_thought(self.name)
+        return next_thought[1] if next_thought else None
     
     def _extract_response_text(self, response: Any) -> str:
         """Extract clean text from LLM response.
@@ -165,6 +163,63 @@ class Character:
             return response.get('text', str(response)).strip()
         return str(response).strip()
     
+    def _build_prompt_inputs(self, message: str, speaker: str, context: Dict[str, Any],
+                             hidden_thought: Optional[str]) -> Dict[str, str]:
+        """Build the input variables for the character response prompt.
+        
+        Args:
+            message (str): The message to respond to
+            speaker (str): The name of who sent the message
+            context (Dict[str, Any]): Additional context like scene description and
+                whether to avoid repeating a recent topic (avoid_similar_response)
+            hidden_thought (Optional[str]): Pre-generated thought for this character, if any
+            
+        Returns:
+            Dict[str, str]: Per-call prompt variables for CHARACTER_RESPONSE_PROMPT; the
+                persona variables are already bound to self.chain
+        """
+        # Handle special message types
+        if message == "SCENE_START":
+            logging.info(f"Character {self.name} generating initial scene response...")
+        elif message == "prompt_user":
+            logging.info(f"Character {self.name} generating user prompt...")
+        
+        return {
+            "context": context.get("scene", ""),
+            "speaker": speaker,
+            "message": (
+                message if message in ["SCENE_START", "prompt_user"] 
+                else ("What are your thoughts on this?" if message == "prompt_user" 
+                else message)
+            ),
+            "memory": self.memory.get_recent_memories(),
+            "response_note": (
+                "Others have just touched on this topic, so bring a fresh angle rather than repeating them."
+                if context.get("avoid_similar_response") else ""
+            ),
+            "current_thought": (
+                "I should take in my surroundings" if message == "SCENE_START"
+                else "I should engage the user in conversation" if message == "prompt_user"
+                else (hidden_thought or "Just focusing on the current situation.")
+            ),
+            "user_name": getattr(self, 'user_name', 'User')
+        }
+    
+    def _fallback_response(self, message: str) -> str:
+        """Get the response text used when generation fails.
+        
+        Args:
+            message (str): The message that was being responded to
+            
+        Returns:
+            str: Fallback response text without the character name prefix
+        """
+        if message == "SCENE_START":
+            return "(enters the scene, looking around with interest)"
+        if message == "prompt_user":
+            return "What are your thoughts on this situation?"
+        return "*looks uncertain*"
+    
     def respond_to(self, message: str, speaker: str, context: Dict[str, str]) -> str:
         """Generate a response to a message.
         
@@ -182,33 +237,9 @@ class Character:
         hidden_thought = self.get_current_thought()
         
         try:
-            # Handle special message types
-            if message == "SCENE_START":
-                logging.info(f"Character {self.name} generating initial scene response...")
-            elif message == "prompt_user":
-                logging.info(f"Character {self.name} generating user prompt...")
-            
-            response = self.chain.invoke({
-                "name": self.name,
-                "personality": self._format_personality(),
-                "gender": self.gender,
-                "background": self.background,
-                "hidden_motive": self.hidden_motive,
-                "context": context.get("scene", ""),
-                "speaker": speaker,
-                "message": (
-                    message if message in ["SCENE_START", "prompt_user"] 
-                    else ("What are your thoughts on this?" if message == "prompt_user" 
-                    else message)
-                ),
-                "memory": self.memory.get_recent_memories(),
-                "current_thought": (
-                    "I should take in my surroundings" if message == "SCENE_START"
-                    else "I should engage the user in conversation" if message == "prompt_user"
-                    else (hidden_thought or "Just focusing on the current situation.")
-                ),
-                "user_name": getattr(self, 'user_name', 'User')
-            })
+            response = self.chain.invoke(
+                self._build_prompt_inputs(message, speaker, context, hidden_thought)
+            )
             
             response_text = self._extract_response_text(response)
             
@@ -227,11 +258,46 @@ class Character:
             
         except Exception as e:
             logging.error(f"Error generating character response: {e}")
-            if message == "SCENE_START":
-                return f"[{self.name}]: (enters the scene, looking around with interest)"
-            if message == "prompt_user":
-                return f"[{self.name}]: What are your thoughts on this situation?"
-            return f"[{self.name}]: *looks uncertain*"
+            return f"[{self.name}]: {self._fallback_response(message)}"
+    
+    def respond_to_stream(self, message: str, speaker: str, 
+                          context: Dict[str, str]) -> Generator[str, None, None]:
+        """Generate a response to a message, yielding text as it arrives from the LLM.
+        
+        The deltas don't include the character name prefix. The complete response
+        is added to the character's memory once the stream is exhausted.
+        
+        Args:
+            message (str): The message to respond to
+            speaker (str): The name of who sent the message
+            context (Dict[str, str]): Additional context like scene description
+            
+        Yields:
+            str: Response text deltas
+        """
+        hidden_thought = self.get_current_thought()
+        chunks = []
+        
+        try:
+            for chunk in self.chain.stream(
+                self._build_prompt_inputs(message, speaker, context, hidden_thought)
+            ):
+                delta = chunk.content if hasattr(chunk, 'content') else str(chunk)
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+        except Exception as e:
+            logging.error(f"Error streaming character response: {e}")
+            if not chunks:
+                chunks.append(self._fallback_response(message))
+                yield chunks[0]
+        
+        self.memory.add_memory(MemoryEvent(
+            speaker=speaker,
+            message=message,
+            response="".join(chunks).strip(),
+            hidden_thought=hidden_thought
+        ))
     
     def set_user_info(self, user_name: str, user_description: str) -> None:
         """Set information about the user for better interaction.
@@ -1,3 +1,42 @@
+import re
+from functools import lru_cache
+
+QUESTION_INDICATORS = (
+    "what", "how", "why", "where", "when", "who", "which",
+    "could you", "would you", "will you", "can you", "do you"
+)
+
+TOPIC_KEYWORDS = {
+    "mystery": ("journal", "key", "symbols", "passage", "chamber", "secret"),
+    "investigation": ("found", "discovered", "search", "look", "examine"),
+    "speculation": ("think", "believe", "suspect", "perhaps", "maybe"),
+}
+
+# Keywords match anywhere in the message (e.g. "key" in "monkey"), as plain substrings
+_QUESTION_RE = re.compile("|".join(map(re.escape, QUESTION_INDICATORS)), re.IGNORECASE)
+_TOPIC_RES = tuple(
+    (1 << bit, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for bit, keywords in enumerate(TOPIC_KEYWORDS.values())
+)
+
+@lru_cache(maxsize=1024)
+def _topic_mask(message: str) -> int:
+    """Get a bitmask with one bit set per topic the message touches on.
+    
+    Memoized since the same history messages are compared turn after turn.
+    
+    Args:
+        message (str): The message text to analyze
+        
+    Returns:
+        int: Bitmask of the TOPIC_KEYWORDS topics (in order) found in the message
+    """
+    mask = 0
+    for bit, pattern in _TOPIC_RES:
+        if pattern.search(message):
+            mask |= bit
+    return mask
+
 class ConversationAnalyzer:
     """Analyzes conversation content and patterns.
     
@@ -6,11 +45,13 @@ class ConversationAnalyzer:
     """
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def is_question(message: str) -> bool:
         """Check if a message is a question.
         
         Analyzes a message to determine if it is phrased as a question by looking
         for common question indicators like question marks and interrogative words.
+        Memoized since flow decisions keep re-checking the same recent messages.
 
         Args:
             message (str): The message text to analyze
@@ -18,19 +59,19 @@ class ConversationAnalyzer:
         Returns:
             bool: True if the message appears to be a question, False otherwise
         """
-        question_indicators = [
-            "?", "what", "how", "why", "where", "when", "who", "which",
-            "could you", "would you", "will you", "can you", "do you"
-        ]
-        message_lower = message.lower()
-        return any(indicator in message_lower for indicator in question_indicators)
+        # Most questions carry a question mark, which needs no regex
+        if "?" in message:
+            return True
+        return _QUESTION_RE.search(message) is not None
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def check_similar_topics(msg1: str, msg2: str) -> bool:
         """Check if two messages discuss similar topics.
         
         Compares two messages to determine if they are discussing related topics
-        by checking for shared keywords in predefined topic categories.
+        by checking for shared keywords in predefined topic categories. Memoized per
+        message pair, since the same pairs recur within a turn.
 
         Args:
             msg1 (str): First message to compare
@@ -39,17 +80,4 @@ class ConversationAnalyzer:
         Returns:
             bool: True if the messages appear to discuss similar topics, False otherwise
         """
-        topic_keywords = {
-            "mystery": ["journal", "key", "symbols", "passage", "chamber", "secret"],
-            "investigation": ["found", "discovered", "search", "look", "examine"],
-            "speculation": ["think", "believe", "suspect", "perhaps", "maybe"],
-        }
-        
-        msg1_lower = msg1.lower()
-        msg2_lower = msg2.lower()
-        
-        return any(
-            any(word in msg1_lower for word in keywords) and 
-            any(word in msg2_lower for word in keywords)
-            for keywords in topic_keywords.values()
-        )
\ No newline at end of file
+        return bool(_topic_mask(msg1) & _topic_mask(msg2))
@@ -1,7 +1,14 @@
-import json
+import atexit
+import logging
+import orjson
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from queue import Empty, Queue
+from typing import Dict, Any, List, Optional
+
+from ..schema import LogEntry
 
 class GameLog:
     """Manages logging of game events, character interactions, and hidden information.
@@ -89,12 +96,7 @@ class GameLog:
         Side Effects:
             Appends event to game_log events list and saves to file
         """
-        event_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "type": event_type,
-            **data
-        }
-        self.game_log["events"].append(event_entry)
+        self.game_log["events"].append(LogEntry(time.time(), event_type, data).as_record())
         self._save_log()
         
     def _save_log(self) -> None:
@@ -103,5 +105,181 @@ class GameLog:
         Side Effects:
             Writes current game_log dictionary to log_file in JSON format
         """
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(self.game_log, f, indent=2, ensure_ascii=False) 
\ No newline at end of file
+        # orjson serializes straight to UTF-8 bytes, written with a single call
+        payload = orjson.dumps(
+            self.game_log,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        with open(self.log_file, 'wb') as f:
+            f.write(payload)
+
+class BufferedGameLog(GameLog):
+    """GameLog that writes events to disk from a background thread.
+    
+    log_event only queues the event, so the conversation never waits on the log
+    file. A single writer thread drains up to BATCH_SIZE queued events at a time
+    and rewrites the file once per batch instead of once per event. Events logged
+    after close() are written directly, since the writer thread has stopped.
+    Events that can't be serialized are logged and dropped so the writer keeps running.
+    
+    Attributes:
+        flush_interval (float): Seconds the writer waits between batches, letting events pile up
+        _pending (Queue): LogEntry tuples waiting to be written, with None as the stop signal
+        _lock (threading.RLock): Guards game_log while it is mutated or serialized
+        _close_lock (threading.Lock): Makes queueing an event and closing mutually exclusive,
+            so no event lands behind the stop signal
+        _writer (threading.Thread): Background thread writing batches to the log file
+    """
+    
+    BATCH_SIZE = 64
+    
+    def __init__(self, log_dir: str = "logs", flush_interval: float = 0.25) -> None:
+        """Initialize the logger and start its writer thread.
+        
+        Args:
+            log_dir (str): Directory path where log files should be stored. Defaults to "logs".
+            flush_interval (float): Seconds to wait between batches. Defaults to 0.25.
+        
+        Side Effects:
+            - Creates log directory if it doesn't exist
+            - Starts the writer thread and registers close() to run at exit
+        """
+        super().__init__(log_dir)
+        self.flush_interval = flush_interval
+        self._pending: Queue = Queue()
+        self._lock = threading.RLock()
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write_batches,
+            name="game-log-writer",
+            daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+    
+    def set_scene(self, scene_description: str) -> None:
+        """Log the initial scene description, serialized against the writer thread.
+        
+        Args:
+            scene_description (str): The narrative description of the game scene
+        """
+        with self._lock:
+            super().set_scene(scene_description)
+    
+    def add_character(self, name: str, config: Dict[str, Any]) -> None:
+        """Log a character's details, serialized against the writer thread.
+        
+        Args:
+            name (str): The character's name
+            config (Dict[str, Any]): Character configuration to log
+        """
+        with self._lock:
+            super().add_character(name, config)
+    
+    def log_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Queue a timestamped game event for the writer thread.
+        
+        Once the log is closed the event is written synchronously instead.
+        
+        Args:
+            event_type (str): Category of event (e.g., "dialogue", "action")
+            data (Dict[str, Any]): Event-specific data to be logged
+        """
+        entry = LogEntry(time.time(), event_type, data)
+        with self._close_lock:
+            if not self._closed:
+                self._pending.put(entry)
+                return
+        
+        with self._lock:
+            self.game_log["events"].append(entry.as_record())
+            self._save_log()
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every queued event has been written to the log file.
+        
+        Args:
+            timeout (Optional[float]): Seconds to wait at most, or None to wait until
+                the queue drains. Defaults to 5.0.
+        
+        Returns:
+            bool: True if the queue drained, False if the wait timed out or the
+                writer thread is no longer running
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending.all_tasks_done:
+            while self._pending.unfinished_tasks:
+                if not self._writer.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                # Wake up periodically in case the writer dies without finishing its tasks
+                self._pending.all_tasks_done.wait(0.5 if remaining is None else min(remaining, 0.5))
+        return True
+    
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write any queued events and stop the writer thread.
+        
+        Safe to call more than once. Closing explicitly also drops the exit hook,
+        so a reset play's logger isn't kept alive until the process ends.
+        
+        Args:
+            timeout (Optional[float]): Seconds to wait for the writer thread to finish
+                the queued events. Defaults to 5.0.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.put(None)
+        self._writer.join(timeout)
+        atexit.unregister(self.close)
+    
+    def _save_log(self) -> None:
+        """Save the current game_log, serialized against the writer thread.
+        
+        Side Effects:
+            Writes current game_log dictionary to log_file in JSON format
+        """
+        with self._lock:
+            super()._save_log()
+    
+    def _write_batches(self) -> None:
+        """Drain queued events in batches until the stop signal arrives."""
+        while True:
+            batch: List[Optional[LogEntry]] = [self._pending.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except Empty:
+                    break
+            
+            events = []
+            for entry in batch:
+                if entry is None:
+                    continue
+                # An event that can't be serialized would fail every later save, so drop it
+                record = entry.as_record()
+                try:
+                    orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+                except Exception as e:
+                    logging.error(f"Dropping game log event that can't be serialized: {e}")
+                    continue
+                events.append(record)
+            
+            if events:
+                try:
+                    with self._lock:
+                        self.game_log["events"].extend(events)
+                        self._save_log()
+                except Exception as e:
+                    logging.error(f"Error writing game log: {e}")
+            
+            for _ in batch:
+                self._pending.task_done()
+            # Nothing is queued after the stop signal, so it always ends its batch
+            if batch[-1] is None:
+                return
+            time.sleep(self.flush_interval)
@@ -0,0 +1,111 @@
+import asyncio
+import httpx
+import os
+import threading
+from functools import lru_cache
+from langchain_groq import ChatGroq
+from typing import Any, Dict
+
+# Keep-alive pool shared by every ChatGroq instance in the process
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60)
+HTTP_TIMEOUT = httpx.Timeout(60.0)
+
+@lru_cache(maxsize=None)
+def get_http_client() -> httpx.Client:
+    """Get the process-wide HTTP client used for Groq requests.
+    
+    Sharing one client lets all agents reuse pooled keep-alive connections
+    instead of paying a TCP + TLS handshake per model instance.
+    
+    Returns:
+        httpx.Client: The shared HTTP client
+    """
+    return httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+@lru_cache(maxsize=None)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client used for Groq requests.
+    
+    Async calls all run on the loop from get_async_loop, so one pooled client
+    can serve every model instead of each ChatGroq opening its own.
+    
+    Returns:
+        httpx.AsyncClient: The shared async HTTP client
+    """
+    return httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+@lru_cache(maxsize=None)
+def get_async_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop used for async LLM calls.
+    
+    The loop runs forever on a daemon thread. Each ChatGroq instance keeps one
+    async HTTP client, which must stay on a single loop, so every async call
+    in the process is scheduled here with asyncio.run_coroutine_threadsafe.
+    
+    Returns:
+        asyncio.AbstractEventLoop: The shared, already running event loop
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-async-loop", daemon=True).start()
+    return loop
+
+# ChatGroq settings per speed tier. "instant" serves short, frequent calls like
+# narrator observations; "balanced" serves bounded JSON generation; "character"
+# and "reasoning" serve character dialogue and orchestration. Models are read
+# from the environment when a tier is resolved, after load_dotenv has run.
+SPEED_MAP: Dict[str, Dict[str, Any]] = {
+    "instant": {
+        "model_env": "NARRATOR_MODEL",
+        "default_model": "llama-3.1-8b-instant",
+        "temperature": 0.3,
+        "max_tokens": 96,
+        "max_retries": 2
+    },
+    "balanced": {
+        "model_env": "SCENARIO_MODEL",
+        "temperature": 0.5,
+        "max_tokens": 1024,
+        "model_kwargs": {"response_format": {"type": "json_object"}}
+    },
+    "character": {
+        "model_env": "CHARACTER_MODEL"
+    },
+    "reasoning": {
+        "model_env": "ORCHESTRATOR_MODEL",
+        "temperature": 0.25
+    }
+}
+
+def tier_settings(tier: str) -> Dict[str, Any]:
+    """Resolve the ChatGroq keyword arguments for a speed tier.
+    
+    Args:
+        tier (str): Name of the tier in SPEED_MAP
+        
+    Returns:
+        Dict[str, Any]: Keyword arguments for ChatGroq, including the model name
+    """
+    settings = dict(SPEED_MAP[tier])
+    model_env = settings.pop("model_env")
+    settings["model_name"] = os.getenv(model_env, settings.pop("default_model", None))
+    return settings
+
+@lru_cache(maxsize=None)
+def get_llm(tier: str) -> ChatGroq:
+    """Get the process-wide language model for a speed tier.
+    
+    Models are stateless between calls, so every agent on a tier shares one
+    instance backed by the pooled sync and async HTTP clients.
+    
+    Args:
+        tier (str): Name of the tier in SPEED_MAP
+        
+    Returns:
+        ChatGroq: The shared language model instance for the tier
+    """
+    return ChatGroq(
+        api_key=os.getenv("GROQ_API_KEY"),
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+        **tier_settings(tier)
+    )
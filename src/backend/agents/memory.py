@@ -1,6 +1,7 @@
 from collections import deque
-from typing import Union, List
-from langchain_core.messages import HumanMessage, AIMessage, trim_messages
+from itertools import islice
+from typing import Optional, Tuple, Union
+from langchain_core.messages import HumanMessage, AIMessage
 
 from ..schema import MemoryEvent
 
@@ -14,23 +15,20 @@ class MemoryManager:
             max_memories: Maximum number of memories to store. Defaults to 10.
         """
         self.memories: deque[MemoryEvent] = deque(maxlen=max_memories)
-        self.message_history: List[Union[HumanMessage, AIMessage]] = []
+        # Each exchange is stored as two messages, so the history holds twice as many
+        self.message_history: deque[Union[HumanMessage, AIMessage]] = deque(maxlen=max_memories * 2)
+        # Bumped on every new memory so the formatted string below can be reused until then
+        self._version = 0
+        self._recent_cache: Optional[Tuple[int, int, str]] = None
     
     def add_memory(self, event: MemoryEvent) -> None:
         """Add a new memory event to the memory store."""
         self.memories.append(event)
-        self.message_history.extend([
-            HumanMessage(content=event.message),
-            AIMessage(content=event.response)
-        ])
-        # Keep message history in sync with deque size
-        self.message_history = trim_messages(
-            self.message_history,
-            max_tokens=self.memories.maxlen * 2,  # *2 because each exchange has 2 messages
-            token_counter=len,  # Simple message counting
-            strategy="last",
-            start_on="human"
-        )
+        self._version += 1
+        # The bounded deque evicts the oldest exchange, keeping history in sync with memories.
+        # Contents are generated internally, so pydantic validation is skipped.
+        self.message_history.append(HumanMessage.model_construct(content=event.message))
+        self.message_history.append(AIMessage.model_construct(content=event.response))
     
     def get_recent_memories(self, count: int = 3, as_messages: bool = False) -> Union[str, dict]:
         """Get a representation of the most recent memories.
@@ -43,7 +41,14 @@ class MemoryManager:
             Either a string of formatted memories or dict with message history.
         """
         if as_messages:
-            return {"chat_history": self.message_history[-count*2:]}  # *2 for message pairs
+            start = max(0, len(self.message_history) - count * 2)  # *2 for message pairs
+            return {"chat_history": list(islice(self.message_history, start, None))}
             
-        recent = list(self.memories)[-count:]
-        return "\n".join(str(memory) for memory in recent)
\ No newline at end of file
+        cached = self._recent_cache
+        if cached and cached[0] == self._version and cached[1] == count:
+            return cached[2]
+        
+        start = max(0, len(self.memories) - count)
+        recent = "\n".join(str(memory) for memory in islice(self.memories, start, None))
+        self._recent_cache = (self._version, count, recent)
+        return recent
\ No newline at end of file
@@ -1,35 +1,52 @@
 import logging
-import os
 from langchain_groq import ChatGroq
-from typing import List, Optional
+from typing import Generator, Iterator, List, Optional, Tuple
 
-from .prompts import NARRATOR_OBSERVATION_PROMPT
+from .llm_pool import get_llm
+from ..cache import LRUCache, prompt_cache_key
+from .prompts import NARRATOR_OBSERVATION_PROMPT, NARRATOR_BATCH_OBSERVATION_PROMPT
 from ..schema import SceneEvent, EventType
+from ..utils import clean_json_response
+
+# Token cap for batched observations, which return several narrations at once
+BATCH_MAX_TOKENS = 384
 
 
 class Narrator:
     """Manages scene narration and observes character interactions.
     
     Maintains scene history and provides atmospheric narration when appropriate.
+    
+    Attributes:
+        response_cache (LRUCache): Observations keyed by their prompt inputs, kept
+            for the current play
     """
     
-    def __init__(self) -> None:
-        """Initialize the Narrator."""
+    def __init__(self, response_cache: Optional[LRUCache] = None) -> None:
+        """Initialize the Narrator.
+        
+        Args:
+            response_cache (Optional[LRUCache]): Cache for observations, e.g. the play's
+                response cache. Defaults to a new cache of the narrator's own
+        """
+        self.response_cache = response_cache if response_cache is not None else LRUCache()
         self.scene_history: List[SceneEvent] = []
         self.current_scene: Optional[str] = None
         self.llm = self._initialize_llm()
         self.chain = NARRATOR_OBSERVATION_PROMPT | self.llm
+        # A batch answers for several interactions, so it gets a larger token cap
+        self.batch_chain = NARRATOR_BATCH_OBSERVATION_PROMPT | self.llm.bind(max_tokens=BATCH_MAX_TOKENS)
     
     def _initialize_llm(self) -> ChatGroq:
-        """Initialize the language model.
+        """Get the shared language model on the "instant" tier.
+        
+        Observations are short and frequent, so they use a small, fast model
+        with a low token cap.
         
         Returns:
             ChatGroq: Configured language model instance
         """
-        return ChatGroq(
-            api_key=os.getenv("GROQ_API_KEY"),
-            model_name=os.getenv("ORCHESTRATOR_MODEL")
-        )
+        return get_llm("instant")
 
     def _format_narrator_message(self, message: str) -> str:
         """Format a message with narrator prefix.
@@ -79,12 +96,17 @@ class Narrator:
             return ""
             
         try:
-            observation = self.chain.invoke({
+            inputs = {
                 "speaker": speaker,
                 "listener": listener,
                 "message": message,
                 "current_scene": self.current_scene
-            }).content.strip()
+            }
+            cache_key = prompt_cache_key("narrator_observation", inputs)
+            observation = self.response_cache.get(cache_key)
+            if observation is None:
+                observation = self.chain.invoke(inputs).content.strip()
+                self.response_cache.put(cache_key, observation)
             
             if observation.upper() == "SKIP":
                 return ""
@@ -96,27 +118,156 @@ class Narrator:
             logging.error(f"Error in narrator observation: {e}")
             return ""
     
-    def get_observation(self) -> str:
-        """Generate an observation based on the last interaction in the scene history.
+    def observe_interaction_stream(self, speaker: str, listener: str, 
+                                   message: str) -> Generator[str, None, None]:
+        """Observe an interaction, yielding the narration as it arrives from the LLM.
+        
+        The start of the response is held back until it's clear the narrator didn't
+        answer "SKIP", so nothing is yielded when no narration is needed.
+        
+        Args:
+            speaker: Name of the speaking character
+            listener: Name of the listening character
+            message: The spoken message
+            
+        Yields:
+            str: Narration text deltas, without the narrator prefix
+        """
+        if not self.current_scene:
+            return
+        
+        chunks = []
+        try:
+            inputs = {
+                "speaker": speaker,
+                "listener": listener,
+                "message": message,
+                "current_scene": self.current_scene
+            }
+            cache_key = prompt_cache_key("narrator_observation", inputs)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                if cached.upper() == "SKIP":
+                    return
+                chunks.append(cached)
+                yield cached
+                self._add_to_history(cached, EventType.OBSERVATION)
+                return
+            
+            stream = iter(self.chain.stream(inputs))
+            
+            for chunk in stream:
+                chunks.append(chunk.content)
+                if len("".join(chunks).strip()) >= len("SKIP"):
+                    break
+            
+            head = "".join(chunks).lstrip()
+            if not head or head.upper().startswith("SKIP"):
+                self.response_cache.put(cache_key, "SKIP")
+                return
+            yield head
+            
+            for chunk in stream:
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+            
+            self.response_cache.put(cache_key, "".join(chunks).strip())
+            
+        except Exception as e:
+            logging.error(f"Error in streamed narrator observation: {e}")
+            if not chunks:
+                return
         
+        self._add_to_history("".join(chunks).strip(), EventType.OBSERVATION)
+    
+    def observe_batch(self, interactions: List[Tuple[str, str, str]]) -> List[str]:
+        """Observe several interactions with a single LLM call.
+        
+        Args:
+            interactions: List of (speaker, listener, message) tuples, oldest first
+            
         Returns:
-            str: Observation string or empty if no observation is needed
+            List[str]: Formatted narrator messages for the interactions that needed
+                narration, in order; empty if none did or the call failed
+        """
+        if not self.current_scene or not interactions:
+            return []
+        
+        try:
+            response = self.batch_chain.invoke({
+                "interactions": "\n".join(
+                    f'{i}. {speaker} says to {listener}: "{message}"'
+                    for i, (speaker, listener, message) in enumerate(interactions, 1)
+                ),
+                "count": len(interactions),
+                "current_scene": self.current_scene
+            }).content.strip()
+            
+            observations = clean_json_response(response)
+            if not isinstance(observations, list):
+                logging.error("Failed to parse batched narrator observations")
+                return []
+            
+            narrations = []
+            for observation in observations:
+                observation = str(observation).strip()
+                if not observation or observation.upper() == "SKIP":
+                    continue
+                self._add_to_history(observation, EventType.OBSERVATION)
+                narrations.append(self._format_narrator_message(observation))
+            return narrations
+            
+        except Exception as e:
+            logging.error(f"Error in batched narrator observation: {e}")
+            return []
+    
+    def _last_interaction(self) -> Optional[Tuple[str, str, str]]:
+        """Get the last interaction in the scene history, if it still needs observing.
+        
+        Returns:
+            Optional[Tuple[str, str, str]]: (speaker, listener, message) of the last
+                event, or None if there is nothing to observe
         """
         if not self.scene_history:
-            return ""
+            return None
         
         # Get the last interaction event
         last_event = self.scene_history[-1]
         
         # Check if the last event was an observation
         if last_event.type == EventType.OBSERVATION:
-            return ""
+            return None
         
         # Attempt to split the description into speaker, listener, and message
         try:
             speaker, listener, message = last_event.description.split(" to ", 2)
         except ValueError:
             logging.error(f"Unexpected format in scene event description: {last_event.description}")
+            return None
+        
+        return speaker, listener, message
+    
+    def get_observation(self) -> str:
+        """Generate an observation based on the last interaction in the scene history.
+        
+        Returns:
+            str: Observation string or empty if no observation is needed
+        """
+        interaction = self._last_interaction()
+        if not interaction:
             return ""
         
-        return self.observe_interaction(speaker, listener, message)
\ No newline at end of file
+        return self.observe_interaction(*interaction)
+    
+    def get_observation_stream(self) -> Iterator[str]:
+        """Stream an observation of the last interaction in the scene history.
+        
+        Returns:
+            Iterator[str]: Narration text deltas; empty if no observation is needed
+        """
+        interaction = self._last_interaction()
+        if not interaction:
+            return iter(())
+        
+        return self.observe_interaction_stream(*interaction)
\ No newline at end of file
@@ -1,17 +1,49 @@
+import asyncio
 import logging
-import os
 import random
 import time
 import threading
+from collections import Counter, deque
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from langchain_core.runnables import Runnable
 from langchain_groq import ChatGroq
-from typing import Dict, Tuple, Optional, List, Any
-from queue import Queue
+from typing import Deque, Dict, Tuple, Optional, List, Any
+from queue import Empty, Queue
 
+from .llm_pool import get_async_loop, get_llm
+from ..cache import LRUCache, prompt_cache_key
 from .conversation_analyzer import ConversationAnalyzer
 from .prompts import ORCHESTRATOR_FLOW_PROMPT, CHARACTER_THOUGHT_PROMPT
 from ..schema import ConversationEvent, FlowConfig, OrchestratorConfig
 
+@lru_cache(maxsize=None)
+def _format_traits(traits: Tuple[Tuple[str, float], ...]) -> str:
+    """Format personality traits, memoized since personalities never change mid-play.
+    
+    Args:
+        traits: (trait, value) pairs in config order
+        
+    Returns:
+        str: Formatted string of personality traits and values
+    """
+    return ", ".join([f"{k}: {v:.1f}" for k, v in traits])
+
+# Chances are compared as integers against a draw of this many random bits
+_CHANCE_BITS = 30
+
+def _chance_threshold(probability: float) -> int:
+    """Convert a probability into an integer threshold for _CHANCE_BITS-bit draws.
+    
+    Args:
+        probability: Chance of success, between 0 and 1
+        
+    Returns:
+        int: Threshold a getrandbits(_CHANCE_BITS) draw must fall below to succeed
+    """
+    return int(probability * (1 << _CHANCE_BITS))
+
 class ConversationFlow:
     """Handles the logic for determining conversation flow and turn-taking.
     
@@ -20,22 +52,47 @@ class ConversationFlow:
     
     Attributes:
         characters (Dict[str, Any]): Dictionary of character objects
-        last_user_interaction (float): Timestamp of last user interaction
+        _character_names (Tuple[str, ...]): Character names, captured once at construction
+        last_user_interaction (int): Monotonic time of last user interaction, in nanoseconds
         config (FlowConfig): Configuration settings for conversation flow
         analyzer (ConversationAnalyzer): Utility for analyzing conversation content
+        _rng (random.Random): Random number generator for turn-taking decisions
     """
     
-    def __init__(self, characters: Dict[str, Any], config: Optional[FlowConfig] = None):
+    def __init__(self, characters: Dict[str, Any], config: Optional[FlowConfig] = None,
+                 rng: Optional[random.Random] = None):
         """Initialize the ConversationFlow manager.
         
         Args:
             characters: Dictionary mapping character names to character objects
             config: Optional configuration settings, uses defaults if not provided
+            rng: Optional random number generator, e.g. the play's seeded one
         """
         self.characters = characters
-        self.last_user_interaction: float = time.time()
+        # Characters are fixed once the play starts, so the names are captured once
+        self._character_names: Tuple[str, ...] = tuple(characters)
+        self.last_user_interaction: int = time.monotonic_ns()
         self.config = config or FlowConfig()
         self.analyzer = ConversationAnalyzer()
+        self._rng = rng or random.Random()
+        
+        # Thresholds are fixed for the play, so convert them once
+        self._idle_threshold_ns = int(self.config.idle_time_threshold * 1_000_000_000)
+        self._initiation_threshold = _chance_threshold(self.config.initiation_chance)
+        self._user_response_threshold = _chance_threshold(self.config.user_response_chance)
+        self._direct_response_threshold = _chance_threshold(self.config.direct_response_chance)
+        self._user_target_threshold = _chance_threshold(0.6)
+    
+    def _roll(self, threshold: int) -> bool:
+        """Draw against a precomputed chance threshold.
+        
+        Args:
+            threshold: Threshold from _chance_threshold
+            
+        Returns:
+            bool: True if the draw succeeds
+        """
+        return self._rng.getrandbits(_CHANCE_BITS) < threshold
         
     def should_initiate_conversation(self) -> bool:
         """Determine if a character should initiate conversation.
@@ -43,10 +100,10 @@ class ConversationFlow:
         Returns:
             bool: True if enough idle time has passed and random chance succeeds
         """
-        time_since_user = time.time() - self.last_user_interaction
+        time_since_user = time.monotonic_ns() - self.last_user_interaction
         return (
-            time_since_user > self.config.idle_time_threshold and
-            random.random() < self.config.initiation_chance
+            time_since_user > self._idle_threshold_ns and
+            self._roll(self._initiation_threshold)
         )
     
     def get_next_speaker(self, last_event: Optional[ConversationEvent], 
@@ -88,7 +145,7 @@ class ConversationFlow:
         """
         if not active_characters:
             return "user", "ALL", "Waiting for initial user input"
-        speaker = random.choice(active_characters)
+        speaker = self._rng.choice(active_characters)
         return speaker, "ALL", "Starting new conversation thread"
 
     def _should_wait_for_user_response(self, last_event: ConversationEvent) -> bool:
@@ -101,9 +158,9 @@ class ConversationFlow:
             bool: True if system should wait for user response
         """
         # Wait if the last message was a question to the user
-        if (last_event.target.lower() == "user" and 
+        if (last_event.is_user_target and 
             self.analyzer.is_question(last_event.message) and 
-            random.random() < self.config.user_response_chance):
+            self._roll(self._user_response_threshold)):
             return True
         return False
 
@@ -117,7 +174,7 @@ class ConversationFlow:
             bool: True if the last event was a direct address to a character
         """
         return (last_event.target in self.characters and 
-                random.random() < self.config.direct_response_chance)
+                self._roll(self._direct_response_threshold))
 
     def _get_default_next_speaker(self, last_event: ConversationEvent, 
                                 active_characters: List[str]) -> Tuple[str, str, str]:
@@ -137,8 +194,8 @@ class ConversationFlow:
             return "user", "ALL", "Waiting for user input"
             
         if self.should_initiate_conversation():
-            speaker = random.choice(active_characters)
-            target = "User" if random.random() < 0.6 else random.choice(list(self.characters.keys()))
+            speaker = self._rng.choice(active_characters)
+            target = "User" if self._roll(self._user_target_threshold) else self._rng.choice(self._character_names)
             return speaker, target, "Initiating new conversation thread"
             
         return "user", last_event.speaker, "Continuing conversation"
@@ -151,17 +208,29 @@ class ThoughtManager:
     
     Attributes:
         characters (Dict[str, Any]): Dictionary of character objects
-        llm (ChatGroq): Language model for generating thoughts
+        llm (Runnable): Language model for generating thoughts
+        thought_chain: Prompt chain for generating thoughts
         narrator (Any): Narrator object for scene context
         game_log (Any): Logger for game events
         config (OrchestratorConfig): Configuration settings
         thoughts_queue (Queue): Queue for storing generated thoughts
+        _counts (Counter): Number of queued thoughts per character, kept in step with the queue
+        _queued_total (int): Total number of queued thoughts, so the full check is O(1)
+        _counts_lock (threading.Lock): Guards _counts and scans of the queue
+        _refill_cv (threading.Condition): Wakes the producer when a thought is taken
         thoughts_thread (threading.Thread): Background thread for thought generation
-        conversation_history (List[ConversationEvent]): Recent conversation events
+        _stopped (threading.Event): Set by stop() to end the thought generation loop
+        conversation_history (Deque[ConversationEvent]): Recent conversation events, shared
+            with the orchestrator that appends to it
+        recent_history (str): The last two events formatted for the thought prompt,
+            kept up to date by record_event
+        _thought_cache (LRUCache): Generated thoughts keyed by their prompt inputs
+        _rng (random.Random): Random number generator for cache bypass rolls
     """
     
-    def __init__(self, characters: Dict[str, Any], llm: ChatGroq, 
-                 narrator: Any, game_log: Any, config: OrchestratorConfig):
+    def __init__(self, characters: Dict[str, Any], llm: Runnable, 
+                 narrator: Any, game_log: Any, config: OrchestratorConfig,
+                 history: Optional[Deque[ConversationEvent]] = None):
         """Initialize the ThoughtManager.
         
         Args:
@@ -170,15 +239,29 @@ class ThoughtManager:
             narrator: Narrator object for scene context
             game_log: Logger for game events
             config: Configuration settings for the orchestrator
+            history: Conversation history deque to read from; pass the orchestrator's
+                own deque so both see every append without copying
         """
         self.characters = characters
         self.llm = llm
+        self.thought_chain = CHARACTER_THOUGHT_PROMPT | llm
         self.narrator = narrator
         self.game_log = game_log
         self.config = config
         self.thoughts_queue: Queue = Queue()
+        self._counts: Counter = Counter()
+        self._queued_total = 0
+        self._counts_lock = threading.Lock()
+        self._refill_cv = threading.Condition(self._counts_lock)
         self.thoughts_thread = None
-        self.conversation_history: List[ConversationEvent] = []
+        self._stopped = threading.Event()
+        self.conversation_history: Deque[ConversationEvent] = (
+            history if history is not None else deque(maxlen=config.max_history_length)
+        )
+        self._recent_lines: Deque[str] = deque(maxlen=2)
+        self.recent_history = ""
+        self._thought_cache = LRUCache(maxsize=config.thought_cache_size)
+        self._rng = random.Random()
         self._start_thoughts_thread()
 
     def _start_thoughts_thread(self) -> None:
@@ -191,69 +274,192 @@ class ThoughtManager:
 
     def _preload_thoughts(self) -> None:
         """Continuously generate and queue character thoughts in background."""
-        while True:
+        max_queue_size = len(self.characters) * self.config.thought_queue_multiplier
+        while not self._stopped.is_set():
             try:
-                max_queue_size = len(self.characters) * self.config.thought_queue_multiplier
-                current_size = self.thoughts_queue.qsize()
+                with self._refill_cv:
+                    # Bail out before anything else while the queue is full, sleeping until a
+                    # consumer takes a thought or stop() is called; the timeout covers missed notifies
+                    if self._queued_total >= max_queue_size and not self._refill_cv.wait_for(
+                        lambda: self._queued_total < max_queue_size or self._stopped.is_set(),
+                        timeout=5
+                    ):
+                        continue
+                    if self._stopped.is_set():
+                        break
+                    char_thought_counts = {
+                        char_name: self._counts[char_name] for char_name in self.characters
+                    }
                 
-                if current_size < max_queue_size:
-                    char_thought_counts = {char_name: 0 for char_name in self.characters}
-                    
-                    # Count existing thoughts
-                    for _ in range(current_size):
-                        char_name, thought = self.thoughts_queue.get()
-                        char_thought_counts[char_name] += 1
-                        self.thoughts_queue.put((char_name, thought))
-                    
-                    # Generate thoughts for characters with fewer thoughts
-                    for char_name, count in char_thought_counts.items():
-                        if count < self.config.thought_queue_multiplier:
-                            char = self.characters[char_name]
-                            thought = self._generate_hidden_thought(char)
-                            if thought:
-                                self.thoughts_queue.put((char_name, thought))
-                            
-                time.sleep(1)
+                # Generate thoughts for characters with fewer thoughts in one batch
+                needy = [
+                    char_name for char_name, count in char_thought_counts.items()
+                    if count < self.config.thought_queue_multiplier
+                ]
+                thoughts = self._generate_hidden_thoughts(
+                    [self.characters[char_name] for char_name in needy]
+                )
+                produced = False
+                for char_name, thought in zip(needy, thoughts):
+                    if thought:
+                        self._enqueue_thought(char_name, thought)
+                        produced = True
+                
+                # Back off instead of hammering the LLM while generation keeps failing
+                if not produced:
+                    self._stopped.wait(1)
             except Exception as e:
                 logging.error(f"Error preloading thoughts: {e}")
-                time.sleep(5)
+                self._stopped.wait(5)
 
-    def _generate_hidden_thought(self, character: Any) -> Optional[str]:
-        """Generate a hidden thought for a character.
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the thought generation thread.
         
         Args:
-            character: Character object to generate thought for
+            timeout: Seconds to wait for a generation call still in flight to finish
+        """
+        self._stopped.set()
+        with self._refill_cv:
+            self._refill_cv.notify_all()
+        if self.thoughts_thread is not None:
+            self.thoughts_thread.join(timeout)
+
+    def record_event(self, event: ConversationEvent) -> None:
+        """Roll a new conversation event into the formatted recent history.
+        
+        Args:
+            event: The event just appended to the conversation history
+        """
+        self._recent_lines.append(f"{event.speaker} to {event.target}: {event.message}")
+        # Rebinding a str is atomic, so the thought thread never sees a half-built value
+        self.recent_history = "\n".join(self._recent_lines)
+
+    def _enqueue_thought(self, char_name: str, thought: str) -> None:
+        """Queue a generated thought and count it against its character.
+        
+        Args:
+            char_name: Name of the character the thought belongs to
+            thought: The generated thought text
+        """
+        with self._counts_lock:
+            self.thoughts_queue.put((char_name, thought))
+            self._counts[char_name] += 1
+            self._queued_total += 1
+
+    def take_thought(self, char_name: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """Take a queued thought, optionally only one belonging to a given character.
+        
+        Args:
+            char_name: Character whose thought to take, or None for whichever is next
             
         Returns:
-            str: Generated thought text, or None if generation fails
+            Optional[Tuple[str, str]]: Tuple of (character_name, thought), or None if
+                no matching thought is queued
         """
-        try:
-            chain = CHARACTER_THOUGHT_PROMPT | self.llm
+        with self._counts_lock:
+            # The counter tells us up front whether scanning the queue can succeed
+            if char_name is not None and not self._counts[char_name]:
+                return None
             
-            # Format recent history
-            recent_history = "\n".join([
-                f"{event.speaker} to {event.target}: {event.message}"
-                for event in self.conversation_history[-2:]  # Get last 2 messages
-            ])
+            for _ in range(self.thoughts_queue.qsize()):
+                try:
+                    name, thought = self.thoughts_queue.get_nowait()
+                except Empty:
+                    return None
+                
+                if char_name is None or name == char_name:
+                    self._counts[name] -= 1
+                    self._queued_total -= 1
+                    self._refill_cv.notify()
+                    return name, thought
+                
+                # Put back thoughts for other characters
+                self.thoughts_queue.put((name, thought))
+        return None
 
-            response = chain.invoke({
-                "name": character.config.name,
-                "personality": self._format_character_traits(character),
-                "motive": character.config.hidden_motive,
-                "scene": self.narrator.current_scene,
-                "history": recent_history  # Add this line
-            }).content.strip()
+    def _build_thought_inputs(self, character: Any, recent_history: str) -> Dict[str, str]:
+        """Build the thought prompt inputs for a character.
+        
+        Args:
+            character: Character object to generate thought for
+            recent_history: Formatted recent conversation shared by all characters
+            
+        Returns:
+            Dict[str, str]: Input variables for CHARACTER_THOUGHT_PROMPT
+        """
+        return {
+            "name": character.config.name,
+            "personality": self._format_character_traits(character),
+            "motive": character.config.hidden_motive,
+            "scene": self.narrator.current_scene,
+            "history": recent_history
+        }
 
+    def _generate_hidden_thoughts(self, characters: List[Any]) -> List[Optional[str]]:
+        """Generate hidden thoughts for several characters in one batched call.
+        
+        Characters whose name, personality, motive, scene and recent history are
+        unchanged since an earlier thought reuse it from the cache, except for an
+        occasional bypass so a quiet scene still gets fresh thoughts. A cached
+        thought that is still queued for its character is regenerated instead, so
+        the queue never holds the same thought twice.
+        
+        Args:
+            characters: Character objects to generate thoughts for
+            
+        Returns:
+            List[Optional[str]]: Thought text per character, in the same order,
+                with None wherever that character's generation failed
+        """
+        recent_history = self.recent_history
+        thoughts: List[Optional[str]] = [None] * len(characters)
+        misses: List[Tuple[int, str]] = []
+        inputs: List[Dict[str, str]] = []
+        with self._counts_lock:
+            queued = set(self.thoughts_queue.queue)
+        
+        for index, character in enumerate(characters):
+            char_inputs = self._build_thought_inputs(character, recent_history)
+            cache_key = prompt_cache_key("character_thought", char_inputs)
+            cached = None
+            if self._rng.random() >= self.config.thought_cache_bypass_chance:
+                cached = self._thought_cache.get(cache_key)
+            
+            if cached is not None and (character.config.name, cached) not in queued:
+                thoughts[index] = cached
+            else:
+                misses.append((index, cache_key))
+                inputs.append(char_inputs)
+        
+        if not inputs:
+            return thoughts
+        
+        # Run the batch as coroutines on the shared async loop rather than a
+        # fresh thread per input
+        results = asyncio.run_coroutine_threadsafe(
+            self.thought_chain.abatch(
+                inputs,
+                config={"max_concurrency": len(inputs)},
+                return_exceptions=True
+            ),
+            get_async_loop()
+        ).result()
+        
+        for (index, cache_key), result in zip(misses, results):
+            character = characters[index]
+            if isinstance(result, Exception):
+                logging.error(f"Error generating thought for {character.config.name}: {result}")
+                continue
+            
+            response = result.content.strip()
             if response:
+                self._thought_cache.put(cache_key, response)
                 self.game_log.log_event("hidden_thought", {
                     "character": character.config.name,
                     "thought": response
                 })
-            return response
-            
-        except Exception as e:
-            logging.error(f"Error generating thought: {e}")
-            return None
+            thoughts[index] = response
+        return thoughts
 
     def _format_character_traits(self, character: Any) -> str:
         """Format character traits for prompts.
@@ -264,10 +470,7 @@ class ThoughtManager:
         Returns:
             str: Formatted string of personality traits and values
         """
-        return ", ".join([
-            f"{k}: {v:.1f}" 
-            for k, v in character.config.personality.items()
-        ])
+        return _format_traits(tuple(character.config.personality.items()))
 
 class Orchestrator:
     """Manages conversation flow and character interactions.
@@ -278,18 +481,23 @@ class Orchestrator:
     Attributes:
         config (OrchestratorConfig): Configuration settings
         characters (Dict[str, Any]): Dictionary of character objects
+        _character_names (Tuple[str, ...]): Character names, captured once at construction
         narrator (Any): Narrator object for scene context
         game_log (Any): Logger for game events
         llm (ChatGroq): Language model for generating responses
         chain: Prompt chain for orchestrating flow
-        conversation_history (List[ConversationEvent]): Recent conversation events
+        conversation_history (Deque[ConversationEvent]): Recent conversation events
         flow_manager (ConversationFlow): Manager for conversation flow
         thought_manager (ThoughtManager): Manager for character thoughts
         executor (ThreadPoolExecutor): Thread pool for processing responses
+        _rng (random.Random): Random number generator shared with the flow manager
+        _recent_speakers (Deque[str]): Speakers of the last three events
+        _recent_speaker_set (frozenset): The same speakers as a set, rebuilt on each append
     """
     
     def __init__(self, characters: Dict[str, Any], narrator: Any, game_log: Any,
-                 config: Optional[OrchestratorConfig] = None) -> None:
+                 config: Optional[OrchestratorConfig] = None,
+                 rng: Optional[random.Random] = None) -> None:
         """Initialize the Orchestrator.
         
         Args:
@@ -297,33 +505,73 @@ class Orchestrator:
             narrator: Narrator object for scene context
             game_log: Logger for game events
             config: Optional configuration settings
+            rng: Optional random number generator, e.g. the play's seeded one
         """
         self.config = config or OrchestratorConfig()
         self.characters = characters
+        self._character_names: Tuple[str, ...] = tuple(characters)
         self.narrator = narrator
         self.game_log = game_log
         self.llm = self._initialize_llm()
         self.chain = ORCHESTRATOR_FLOW_PROMPT | self.llm
-        self.conversation_history: List[ConversationEvent] = []
+        self.conversation_history: Deque[ConversationEvent] = deque(
+            maxlen=self.config.max_history_length
+        )
+        self._history_lock = threading.Lock()
+        self._recent_speakers: Deque[str] = deque(maxlen=3)
+        self._recent_speaker_set: frozenset = frozenset()
         
-        self.flow_manager = ConversationFlow(characters)
+        self._rng = rng or random.Random()
+        self.flow_manager = ConversationFlow(characters, rng=self._rng)
+        # Thoughts are one-line monologues, so the instant tier writes them, falling
+        # back to the reasoning model if the fast one fails
+        thought_llm = get_llm("instant").with_fallbacks([self.llm])
         self.thought_manager = ThoughtManager(
-            characters, self.llm, narrator, game_log, self.config
+            characters, thought_llm, narrator, game_log, self.config,
+            history=self.conversation_history
         )
         
-        self.executor = ThreadPoolExecutor(max_workers=len(characters))
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for processing responses, created on first use.
+        
+        Returns:
+            ThreadPoolExecutor: Pool with one worker per character, capped at
+                config.max_concurrent_responses
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, min(len(self.characters), self.config.max_concurrent_responses)),
+                thread_name_prefix="char-resp"
+            )
+        return self._executor
 
     def _initialize_llm(self) -> ChatGroq:
-        """Initialize the language model.
+        """Get the shared language model used for orchestration.
         
         Returns:
             ChatGroq: Configured language model instance
         """
-        return ChatGroq(
-            api_key=os.getenv("GROQ_API_KEY"),
-            model_name=os.getenv("ORCHESTRATOR_MODEL"),
-            temperature=0.25
-        )
+        return get_llm("reasoning")
+
+    def _recent_events(self, count: int) -> Tuple[ConversationEvent, ...]:
+        """Snapshot the last few conversation events, oldest first.
+        
+        Taken under the history lock, so callers work on a stable copy even while
+        another thread appends, and only the requested events are walked.
+        
+        Args:
+            count: Maximum number of events to return
+            
+        Returns:
+            Tuple[ConversationEvent, ...]: Up to count most recent events, in chronological order
+        """
+        with self._history_lock:
+            recent = list(islice(reversed(self.conversation_history), count))
+        recent.reverse()
+        return tuple(recent)
 
     def _get_active_characters(self, exclude: Optional[List[str]] = None) -> List[str]:
         """Get list of characters who haven't spoken recently.
@@ -334,15 +582,12 @@ class Orchestrator:
         Returns:
             List[str]: Names of characters eligible to speak
         """
-        exclude = exclude or []
-        recent_speakers = {
-            event.speaker for event in self.conversation_history[-3:]
-            if event.speaker in self.characters
-        }
-        return [
-            name for name in self.characters.keys()
-            if name not in recent_speakers and name not in exclude
-        ]
+        recent_speakers = self._recent_speaker_set
+        if not exclude:
+            return [name for name in self._character_names if name not in recent_speakers]
+        
+        excluded = recent_speakers.union(exclude)
+        return [name for name in self._character_names if name not in excluded]
 
     def _update_conversation_history(self, speaker: str, target: str, message: str) -> None:
         """Update the conversation history and log the interaction.
@@ -357,13 +602,15 @@ class Orchestrator:
             target=target,
             message=message
         )
-        self.conversation_history.append(event)
         
-        if len(self.conversation_history) > self.config.max_history_length:
-            self.conversation_history = self.conversation_history[-self.config.max_history_length:]
-            
-        # Update thought manager's conversation history
-        self.thought_manager.conversation_history = self.conversation_history
+        # Responses may be recorded from several threads; the deque drops the oldest event
+        # itself, and since the thought manager shares it, the append (atomic under the GIL)
+        # is all it takes for the thought thread to see the event
+        with self._history_lock:
+            self.conversation_history.append(event)
+            self.thought_manager.record_event(event)
+            self._recent_speakers.append(speaker)
+            self._recent_speaker_set = frozenset(self._recent_speakers)
             
         self.game_log.log_event("dialogue", {
             "speaker": speaker,
@@ -371,35 +618,34 @@ class Orchestrator:
             "message": message
         })
 
-    def _process_character_response(self, char_name: str, message: str, target: str) -> None:
-        """Process a character's response in the thread pool.
+    def build_response_context(self, char_name: str, message: str) -> Dict[str, Any]:
+        """Build the context for a character's response to a message.
+        
+        Flags whether the message repeats a topic another character just raised,
+        so the response can take a fresh angle instead.
         
         Args:
             char_name: Name of responding character
             message: Message being responded to
-            target: Target/recipient of the response
+            
+        Returns:
+            Dict[str, Any]: Context with the current scene and an avoid_similar_response flag
         """
+        similar_topics = False
         try:
-            recent_events = self.conversation_history[-3:] if self.conversation_history else []
+            recent_events = self._recent_events(3)
             similar_topics = any(
                 event.speaker != char_name and
                 ConversationAnalyzer.check_similar_topics(message, event.message)
                 for event in recent_events
             )
-            
-            context = {
-                "scene": self.narrator.current_scene,
-                "avoid_similar_response": similar_topics
-            }
-            
-            self.executor.submit(
-                self.characters[char_name].respond_to,
-                message,
-                target,
-                context
-            )
         except Exception as e:
-            logging.error(f"Error processing character response: {e}")
+            logging.error(f"Error building response context: {e}")
+        
+        return {
+            "scene": self.narrator.current_scene,
+            "avoid_similar_response": similar_topics
+        }
 
     def determine_next_interaction(self, last_speaker: str, last_message: str) -> Tuple[str, str, str]:
         """Determine and log the next interaction in the conversation flow.
@@ -416,10 +662,11 @@ class Orchestrator:
         """
         try:
             if last_speaker == "User":
-                self.flow_manager.last_user_interaction = time.time()
+                self.flow_manager.last_user_interaction = time.monotonic_ns()
             
             active_chars = self._get_active_characters()
-            last_event = self.conversation_history[-1] if self.conversation_history else None
+            recent = self._recent_events(1)
+            last_event = recent[0] if recent else None
             
             next_speaker, target, reasoning = self.flow_manager.get_next_speaker(
                 last_event, active_chars
@@ -427,9 +674,6 @@ class Orchestrator:
             
             self._update_conversation_history(last_speaker, target, last_message)
             
-            if next_speaker in self.characters:
-                self._process_character_response(next_speaker, last_message, target)
-            
             self.game_log.log_event("flow_decision", {
                 "last_speaker": last_speaker,
                 "next_speaker": next_speaker,
@@ -453,10 +697,10 @@ class Orchestrator:
             Tuple containing fallback speaker, target and reasoning
         """
         if last_speaker.lower() == "user":
-            char_name = next(iter(self.characters.keys()))
+            char_name = self._character_names[0]
             return (char_name, "User", "Responding to user's message")
         else:
-            return ("user", next(iter(self.characters.keys())), "Awaiting user's response")
+            return ("user", self._character_names[0], "Awaiting user's response")
 
     def get_initial_character_response(self) -> str:
         """Generate initial character response after scene is set.
@@ -465,7 +709,7 @@ class Orchestrator:
             str: Initial character response or fallback message
         """
         try:
-            initial_speaker = random.choice(list(self.characters.keys()))
+            initial_speaker = self._rng.choice(self._character_names)
             char = self.characters[initial_speaker]
             
             response = char.respond_to(
@@ -479,7 +723,7 @@ class Orchestrator:
             
         except Exception as e:
             logging.error(f"Error generating initial response: {e}")
-            return f"[{list(self.characters.keys())[0]}]: *looks around curiously*"
+            return f"[{self._character_names[0]}]: *looks around curiously*"
 
     @property
     def thoughts_queue(self) -> Queue:
@@ -490,16 +734,17 @@ class Orchestrator:
         """
         return self.thought_manager.thoughts_queue
 
-    def get_next_thought(self) -> Optional[Tuple[str, str]]:
+    def get_next_thought(self, char_name: Optional[str] = None) -> Optional[Tuple[str, str]]:
         """Get the next available thought from the queue.
         
+        Args:
+            char_name: Only take a thought belonging to this character, if given
+        
         Returns:
             Optional[Tuple[str, str]]: Tuple of (character_name, thought) or None if queue is empty
         """
         try:
-            if not self.thoughts_queue.empty():
-                return self.thoughts_queue.get_nowait()
-            return None
+            return self.thought_manager.take_thought(char_name)
         except Exception as e:
             logging.error(f"Error getting next thought: {e}")
             return None
\ No newline at end of file
@@ -1,18 +1,10 @@
-from langchain.prompts import PromptTemplate
+from langchain.prompts import ChatPromptTemplate, PromptTemplate
 
-CHARACTER_RESPONSE_TEMPLATE = """
-You are {name}, a character in an interactive play. 
-            
-Your personality traits are: {personality}
-Your gender: {gender}
-Your background: {background}
-Your hidden motive (never reveal this directly): {hidden_motive}
-Your current inner thought: {current_thought}
-
-Current context: {context}
-Previous interactions: {memory}
-
-{speaker} says to you: "{message}"
+# The system message holds everything that stays fixed for a character within a scene,
+# so every turn's request shares the same prefix and the provider can reuse its cache.
+# Per-call values (inner thought, memory, the message itself) go in the human message.
+CHARACTER_SYSTEM_TEMPLATE = """
+You are a character in an interactive play. 
 
 Important guidelines:
 - Stay in character at all times
@@ -37,16 +29,30 @@ Important guidelines:
 - Write only spoken dialogue and actions like it's a play.
 - If getting "SCENE_START" or "prompt_user" messages, do not include your hidden motive in your response, it is only for your internal thoughts.
 
+You are {name}.
+            
+Your personality traits are: {personality}
+Your gender: {gender}
+Your background: {background}
+Your hidden motive (never reveal this directly): {hidden_motive}
+
+Current context: {context}
+"""
+
+CHARACTER_MESSAGE_TEMPLATE = """
+Your current inner thought: {current_thought}
+Previous interactions: {memory}
+
+{speaker} says to you: "{message}"
+{response_note}
+
 Response:
 """
 
-CHARACTER_RESPONSE_PROMPT = PromptTemplate(
-    input_variables=[
-        "name", "personality", "background", "hidden_motive", "context",
-        "speaker", "message", "memory", "current_thought", "user_name"
-    ],
-    template=CHARACTER_RESPONSE_TEMPLATE
-)
+CHARACTER_RESPONSE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", CHARACTER_SYSTEM_TEMPLATE),
+    ("human", CHARACTER_MESSAGE_TEMPLATE)
+])
 
 CHARACTER_THOUGHT_TEMPLATE = """
 Generate a brief hidden thought for {name}, considering:
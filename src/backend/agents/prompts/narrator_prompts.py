@@ -20,4 +20,27 @@ Response:
 NARRATOR_OBSERVATION_PROMPT = PromptTemplate(
     input_variables=["speaker", "listener", "message", "current_scene"],
     template=NARRATOR_OBSERVATION_TEMPLATE
-) 
\ No newline at end of file
+)
+
+NARRATOR_BATCH_OBSERVATION_TEMPLATE = """
+As a subtle narrator in an interactive play, determine which of these interactions need atmospheric description
+or context. Try and match the tone of the scene. Only provide narration for an interaction if any of these conditions are met: 
+1. There's a significant change in mood or atmosphere 
+2. Important physical actions or movements occur 
+3. Environmental changes need to be described 
+4. Critical non-verbal cues need to be highlighted
+
+Current scene: {current_scene} 
+Interactions:
+{interactions}
+
+For each of the {count} interactions, in order, provide either a brief, atmospheric description (2-3 sentences)
+or "SKIP" if no narration is needed.
+
+Return ONLY a JSON array with exactly {count} strings, for example: ["SKIP", "The candles flicker as..."]
+"""
+
+NARRATOR_BATCH_OBSERVATION_PROMPT = PromptTemplate(
+    input_variables=["interactions", "count", "current_scene"],
+    template=NARRATOR_BATCH_OBSERVATION_TEMPLATE
+)
\ No newline at end of file
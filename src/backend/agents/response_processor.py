@@ -1,34 +1,107 @@
 import random
-from typing import Generator, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generator, Dict, Iterator, List, Optional, Tuple, Union
 
 from .character import Character
 from .narrator import Narrator
 
+# Line breaks and tabs become spaces in a single translate pass
+_WHITESPACE_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+_SENTENCE_ENDERS = ('.', '!', '?', '"')
+
+class ResponseStream:
+    """A character response that is delivered incrementally.
+    
+    Iterating the stream yields text deltas as they arrive and records them, so
+    the complete response is available afterwards through `text` and `content`.
+    
+    Attributes:
+        speaker: Name of the character speaking
+    """
+    
+    def __init__(self, speaker: str, deltas: Iterator[str],
+                 formatter: Callable[[str], str] = str.strip) -> None:
+        """Initialize the ResponseStream.
+        
+        Args:
+            speaker: Name of the character speaking
+            deltas: Iterator of response text deltas without the name prefix
+            formatter: Function applied to the complete "[Name]: text" response
+        """
+        self.speaker = speaker
+        self._deltas = deltas
+        self._formatter = formatter
+        self._chunks: List[str] = []
+    
+    def __iter__(self) -> Iterator[str]:
+        """Yield the response text deltas that haven't been consumed yet.
+        
+        Yields:
+            str: Response text deltas
+        """
+        for delta in self._deltas:
+            self._chunks.append(delta)
+            yield delta
+    
+    @property
+    def text(self) -> str:
+        """Get the complete response text, consuming any remaining deltas.
+        
+        Returns:
+            str: The response text without the character name prefix
+        """
+        for _ in self:
+            pass
+        return "".join(self._chunks).strip()
+    
+    @property
+    def content(self) -> str:
+        """Get the complete formatted response in "[Name]: text" form.
+        
+        Returns:
+            str: The formatted response with character name prefix
+        """
+        return self._formatter(f"[{self.speaker}]: {self.text}")
+
 class ResponseProcessor:
     """Processes and formats character responses and generates narration.
     
     Handles formatting of character dialogue, adding appropriate punctuation,
-    and occasionally generates narrative observations of interactions.
+    and occasionally generates narrative observations of interactions. Interactions
+    picked for narration are queued and observed in batches to save LLM round trips.
+    Each batch is narrated on a background thread while dialogue continues, and is
+    yielded once it's ready.
     
     Attributes:
         characters: Dictionary mapping character names to Character objects
         narrator: Narrator instance for generating scene descriptions
+        observation_batch_size: Number of queued interactions sent to the narrator at once
     """
     
-    def __init__(self, characters: Dict[str, Character], narrator: Narrator) -> None:
+    def __init__(self, characters: Dict[str, Character], narrator: Narrator,
+                 observation_batch_size: int = 4, rng: Optional[random.Random] = None) -> None:
         """Initialize the ResponseProcessor.
         
         Args:
             characters: Dictionary mapping character names to Character objects
             narrator: Narrator instance for generating scene descriptions
+            observation_batch_size: Number of queued interactions sent to the narrator at once
+            rng: Random number generator for narration picks, shared with the play manager
+                so seeded plays are reproducible. Defaults to a new unseeded generator
         """
         self.characters = characters
         self.narrator = narrator
+        self.observation_batch_size = observation_batch_size
+        self._rng = rng or random.Random()
+        self._pending_observations: List[Tuple[str, str, str]] = []
+        self._narration_future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         
     def process_response(self, speaker: str, target: str, response: str) -> Generator[str, None, None]:
         """Process a character's response and generate related content.
         
-        Formats the response text and occasionally adds narrative observations.
+        Formats the response text and occasionally queues the interaction for
+        narration. Once enough interactions are queued, they are narrated together.
         
         Args:
             speaker: Name of the character speaking
@@ -40,13 +113,115 @@ class ResponseProcessor:
         """
         response = self._format_response(response)
         yield response
+        yield from self._after_response(speaker, target, response)
+    
+    def create_stream(self, speaker: str, deltas: Iterator[str]) -> ResponseStream:
+        """Wrap a character's streamed response so it is formatted like other responses.
+        
+        Args:
+            speaker: Name of the character speaking
+            deltas: Iterator of response text deltas without the name prefix
+            
+        Returns:
+            ResponseStream: The stream to pass to process_stream
+        """
+        # Normalize whitespace per delta so the text rendered live matches the
+        # formatted response it is later replaced with
+        normalized = (delta.translate(_WHITESPACE_TABLE) for delta in deltas)
+        return ResponseStream(speaker, normalized, self._format_response)
+    
+    def process_stream(self, speaker: str, target: str, 
+                       stream: ResponseStream) -> Generator[Union[str, ResponseStream], None, None]:
+        """Process a streamed character response and generate related content.
+        
+        Yields the stream itself so the caller can render it incrementally, then
+        continues like process_response with the complete response.
+        
+        Args:
+            speaker: Name of the character speaking
+            target: Name of the character being spoken to
+            stream: The streamed response created by create_stream
+            
+        Yields:
+            Union[str, ResponseStream]: The response stream followed by optional
+                narration with pause indicators
+        """
+        yield stream
+        yield from self._after_response(speaker, target, stream.content)
+    
+    def _after_response(self, speaker: str, target: str, response: str) -> Generator[str, None, None]:
+        """Pause after a response and occasionally queue it for narration.
+        
+        Args:
+            speaker: Name of the character speaking
+            target: Name of the character being spoken to
+            response: The formatted response text
+            
+        Yields:
+            str: Pause indicators and any batched narration
+        """
         yield "PAUSE:1"
+        yield from self._collect_narrations(wait=False)
         
-        if random.random() < 0.15:
-            narration = self._generate_narration(speaker, target, response)
-            if narration:
-                yield narration
-                yield "PAUSE:0.5"
+        if self._rng.random() < 0.15:
+            self._pending_observations.append((speaker, target, response))
+            if (len(self._pending_observations) >= self.observation_batch_size
+                    and self._narration_future is None):
+                self._submit_pending_observations()
+    
+    def flush_narrations(self) -> Generator[str, None, None]:
+        """Narrate everything observed this turn and yield the narrations.
+        
+        Waits for any batch still being narrated, then narrates the observations
+        still queued even if they don't fill a batch, so narration never lags
+        behind the turn it describes.
+        
+        Yields:
+            str: Batched narration with pause indicators
+        """
+        yield from self._collect_narrations(wait=True)
+        if self._pending_observations:
+            self._submit_pending_observations()
+            yield from self._collect_narrations(wait=True)
+    
+    def _submit_pending_observations(self) -> None:
+        """Hand the queued observations to the narration worker as one batch."""
+        observations, self._pending_observations = self._pending_observations, []
+        self._narration_future = self.executor.submit(self._generate_narrations, observations)
+    
+    def _collect_narrations(self, wait: bool) -> Generator[str, None, None]:
+        """Yield the narrations of the background batch once it has finished.
+        
+        Args:
+            wait: Whether to block until the batch finishes instead of skipping it
+            
+        Yields:
+            str: Batched narration with pause indicators
+        """
+        future = self._narration_future
+        if future is None or not (wait or future.done()):
+            return
+        
+        self._narration_future = None
+        for narration in future.result():
+            yield narration
+            yield "PAUSE:0.5"
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Single worker thread that narrates batches, created on first use.
+        
+        Returns:
+            ThreadPoolExecutor: The narration worker
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Stop the narration worker if it was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
     
     def _format_response(self, response: str) -> str:
         """Format the response text with proper spacing and punctuation.
@@ -57,23 +232,21 @@ class ResponseProcessor:
         Returns:
             str: Formatted response text with proper spacing and punctuation
         """
-        response = response.replace('\n', ' ').strip()
-        if not response.endswith(('.', '!', '?', '"')):
+        response = response.translate(_WHITESPACE_TABLE).strip()
+        if not response.endswith(_SENTENCE_ENDERS):
             response += '.'
         return response
     
-    def _generate_narration(self, speaker: str, target: str, response: str) -> str:
-        """Generate narrative observation of an interaction between characters.
+    def _generate_narrations(self, observations: List[Tuple[str, str, str]]) -> List[str]:
+        """Generate narrative observations for a batch of interactions.
         
         Args:
-            speaker: Name of the character speaking
-            target: Name of the character being spoken to
-            response: The processed response text
+            observations: The (speaker, target, response) interactions to narrate
             
         Returns:
-            str: Formatted narration text, or empty string if no narration generated
+            List[str]: Formatted narration texts, empty if no narration was generated
         """
-        narration = self.narrator.observe_interaction(speaker, target, response)
-        if narration:
-            narration = self._format_response(narration)
-        return narration 
\ No newline at end of file
+        return [
+            self._format_response(narration)
+            for narration in self.narrator.observe_batch(observations)
+        ]
\ No newline at end of file
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class LRUCache:
+    """A small thread-safe least-recently-used cache.
+    
+    Used to keep LLM outputs around so repeated requests can skip the round trip.
+    
+    Attributes:
+        maxsize (int): Maximum number of entries kept before the oldest is evicted
+    """
+    
+    def __init__(self, maxsize: int = 128) -> None:
+        """Initialize the cache.
+        
+        Args:
+            maxsize (int): Maximum number of entries to keep. Defaults to 128.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value and mark it as recently used.
+        
+        Args:
+            key (Hashable): The cache key
+        
+        Returns:
+            Optional[Any]: The cached value, or None if the key isn't cached
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key (Hashable): The cache key
+            value (Any): The value to store
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Get the number of cached entries.
+        
+        Returns:
+            int: Number of entries currently cached
+        """
+        return len(self._entries)
+
+def prompt_cache_key(namespace: str, inputs: Dict[str, Any]) -> str:
+    """Build an exact-match cache key for a prompt's input variables.
+    
+    Args:
+        namespace (str): Name of the prompt, so identical inputs to different prompts don't collide
+        inputs (Dict[str, Any]): The prompt's input variables
+        
+    Returns:
+        str: Hex digest identifying the prompt and its inputs
+    """
+    payload = json.dumps([namespace, inputs], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
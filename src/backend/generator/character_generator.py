@@ -1,10 +1,46 @@
 import logging
+import sys
 from typing import Dict
 from langchain_groq import ChatGroq
+from langchain_core.exceptions import OutputParserException
+from pydantic import ValidationError
 
 from ..agents import Character, CHARACTER_GENERATION_PROMPT
-from ..schema import CharacterConfig
-from ..utils import clean_json_response
+from ..schema import CharacterConfig, CharacterList
+
+# Output token budget per generated character, so larger casts aren't cut off mid-JSON
+TOKENS_PER_CHARACTER = 300
+
+# Predefined characters used when generation fails; configs are shared, never mutated
+_FALLBACK_CHARACTER_CONFIGS: Dict[str, CharacterConfig] = {
+    "Adventurer": CharacterConfig(
+        name="Adventurer",
+        gender="male",
+        description="A rugged individual with weathered features and well-worn traveling clothes",
+        personality={"bravery": 0.8, "curiosity": 0.9},
+        background="A seasoned explorer seeking ancient treasures",
+        hidden_motive="Searching for a legendary artifact that could save their homeland",
+        emoji="🗺️"
+    ),
+    "Scholar": CharacterConfig(
+        name="Scholar",
+        gender="female",
+        description="A sharp-eyed woman in scholarly robes with wire-rimmed spectacles",
+        personality={"intelligence": 0.9, "caution": 0.7},
+        background="A knowledgeable researcher of ancient ruins",
+        hidden_motive="Secretly working for a mysterious organization",
+        emoji="📚"
+    ),
+    "Guide": CharacterConfig(
+        name="Guide",
+        gender="non-binary",
+        description="A mysterious figure in local garb with keen eyes and quiet demeanor",
+        personality={"wisdom": 0.8, "mystery": 0.6},
+        background="A local expert with deep knowledge of the area",
+        hidden_motive="Protecting an ancient secret about the location",
+        emoji="🧭"
+    )
+}
 
 class CharacterGenerator:
     """Generates character sets for interactive scenarios.
@@ -51,36 +87,41 @@ class CharacterGenerator:
             if character_context:
                 full_description = f"{scene_description}\n\nExpected characters: {character_context}"
             
-            chain = CHARACTER_GENERATION_PROMPT | self.llm
-            response = chain.invoke({
+            # Copy rather than bind: with_structured_output drops bound kwargs
+            llm = self.llm.model_copy(update={"max_tokens": TOKENS_PER_CHARACTER * num_characters})
+            chain = CHARACTER_GENERATION_PROMPT | llm.with_structured_output(
+                CharacterList, method="json_mode"
+            )
+            char_list: CharacterList = chain.invoke({
                 "scene_description": full_description,
                 "num_characters": num_characters,
                 "user_name": user_name,
                 "user_description": user_description
-            }).content.strip()
-            
-            char_data = clean_json_response(response)
-            if not char_data:
-                logging.error("Failed to parse character data, using fallback characters")
-                return self.generate_fallback_characters()
+            })
             
-            characters = {}
-            for char in char_data["characters"]:
+            characters: Dict[str, Character] = {}
+            for spec in char_list.characters:
+                # Interned so dict lookups by name compare by identity
+                name = sys.intern(spec.name)
                 config = CharacterConfig(
-                    name=char["name"],
-                    gender=char.get("gender", "non-binary"),
-                    description=char.get("description", ""),
-                    personality=char["personality"],
-                    background=char["background"],
-                    hidden_motive=char["hidden_motive"],
-                    emoji=char.get("emoji", "👤"),
-                    role_in_scene=char.get("role_in_scene", "")
+                    name=name,
+                    gender=spec.gender,
+                    description=spec.description,
+                    personality=spec.personality,
+                    background=spec.background,
+                    hidden_motive=spec.hidden_motive,
+                    emoji=spec.emoji,
+                    role_in_scene=spec.role_in_scene,
+                    relation_to_user=spec.relation_to_user
                 )
-                characters[char["name"]] = Character(config)
-                logging.info(f"Generated character: {char['name']}, {char.get('emoji', '👤')}")
+                characters[name] = Character(config)
+                logging.info(f"Generated character: {name}, {spec.emoji}")
             
             return characters
                 
+        except (OutputParserException, ValidationError) as e:
+            logging.error(f"Generated characters didn't match the schema, using fallback characters: {e}")
+            return self.generate_fallback_characters()
         except Exception as e:
             logging.error(f"Error during character generation: {e}")
             return self.generate_fallback_characters()
@@ -89,41 +130,12 @@ class CharacterGenerator:
         """Generate a set of predefined fallback characters.
         
         Creates a default set of characters to use when dynamic generation fails.
+        Only the Character instances are new; their configs are shared constants.
         
         Returns:
             Dict[str, Character]: Dictionary mapping character names to Character instances
         """
-        fallback_chars = {
-            "Adventurer": CharacterConfig(
-                name="Adventurer",
-                gender="male",
-                description="A rugged individual with weathered features and well-worn traveling clothes",
-                personality={"bravery": 0.8, "curiosity": 0.9},
-                background="A seasoned explorer seeking ancient treasures",
-                hidden_motive="Searching for a legendary artifact that could save their homeland",
-                emoji="🗺️"
-            ),
-            "Scholar": CharacterConfig(
-                name="Scholar",
-                gender="female",
-                description="A sharp-eyed woman in scholarly robes with wire-rimmed spectacles",
-                personality={"intelligence": 0.9, "caution": 0.7},
-                background="A knowledgeable researcher of ancient ruins",
-                hidden_motive="Secretly working for a mysterious organization",
-                emoji="📚"
-            ),
-            "Guide": CharacterConfig(
-                name="Guide",
-                gender="non-binary",
-                description="A mysterious figure in local garb with keen eyes and quiet demeanor",
-                personality={"wisdom": 0.8, "mystery": 0.6},
-                background="A local expert with deep knowledge of the area",
-                hidden_motive="Protecting an ancient secret about the location",
-                emoji="🧭"
-            )
-        }
-        
         return {
             name: Character(config)
-            for name, config in fallback_chars.items()
+            for name, config in _FALLBACK_CHARACTER_CONFIGS.items()
         } 
\ No newline at end of file
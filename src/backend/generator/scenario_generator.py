@@ -1,9 +1,27 @@
 import logging
 import random
 from langchain_groq import ChatGroq
+from langchain_core.exceptions import OutputParserException
+from pydantic import ValidationError
+from typing import Optional, Tuple
 
 from ..agents.prompts import SCENARIO_GENERATION_PROMPT
-from ..utils import clean_json_response
+from ..schema import ScenarioSpec
+
+# Predefined (scenario_description, character_context, user_role) used when generation fails
+_FALLBACK_SCENARIOS: Tuple[Tuple[str, str, str], ...] = (
+    ("A mysterious tavern on a stormy night. Travelers from different walks of life have sought shelter here, each carrying their own secrets and stories. The atmosphere is tense with unspoken tales and hidden agendas.",
+     "Travelers, innkeeper, mysterious stranger",
+     "A curious traveler seeking shelter from the storm"),
+
+    ("An abandoned mansion during a masquerade ball. The guests are trapped inside by a mysterious force, and everyone seems to have a hidden agenda. The air is thick with intrigue and suspicion.",
+     "Noble guests, servants, mysterious host",
+     "An invited guest at the masquerade"),
+
+    ("A futuristic space station at the edge of known space. The station's systems are malfunctioning, and the diverse crew members each seem to know more than they're letting on. The metallic corridors echo with whispered conspiracies.",
+     "Station crew, engineers, security personnel",
+     "A newly arrived passenger with vital information")
+)
 
 class ScenarioGenerator:
     """Generates interactive scenarios with rich descriptions and character contexts.
@@ -14,15 +32,19 @@ class ScenarioGenerator:
     
     Attributes:
         llm (ChatGroq): Language model instance used for scenario generation
+        _rng (random.Random): Random number generator for picking fallback scenarios
     """
 
-    def __init__(self, llm: ChatGroq):
+    def __init__(self, llm: ChatGroq, rng: Optional[random.Random] = None):
         """Initialize the scenario generator.
         
         Args:
             llm (ChatGroq): Language model instance to use for generation
+            rng (Optional[random.Random]): Random number generator, e.g. the play's
+                seeded one. Defaults to a new unseeded generator
         """
         self.llm = llm
+        self._rng = rng or random.Random()
 
     def generate_scenario(self, user_name: str, user_description: str) -> tuple[str, str, str]:
         """Generate a complete scenario with setting, situation and character context.
@@ -41,36 +63,49 @@ class ScenarioGenerator:
                 - user_role: The user's specific role in the scenario
                 
         Note:
-            Falls back to predefined scenarios if generation fails
+            Falls back to predefined scenarios if generation fails. Every call asks the
+            LLM for a new scenario; results aren't cached, since the user asked for a
+            fresh one
         """
         try:
-            chain = SCENARIO_GENERATION_PROMPT | self.llm
-            response = chain.invoke({
+            chain = SCENARIO_GENERATION_PROMPT | self.llm.with_structured_output(
+                ScenarioSpec, method="json_mode"
+            )
+            scenario: ScenarioSpec = chain.invoke({
                 "user_name": user_name,
                 "user_description": user_description
-            }).content
-            
-            scenario_data = clean_json_response(response)
-            if not scenario_data:
-                logging.error("Failed to parse scenario data, using fallback scenario")
-                return self.get_fallback_scenario()
-            
-            scenario_description = (
-                f"{scenario_data['setting']}. "
-                f"{scenario_data['situation']} "
-                f"{scenario_data['atmosphere']}\n\n"
-                f"Your role: {scenario_data['user_role']}"
-            )
-            
-            return (
-                scenario_description,
-                scenario_data.get('character_context', ''),
-                scenario_data.get('user_role', '')
-            )
+            })
+            return self._describe(scenario)
+        except (OutputParserException, ValidationError) as e:
+            logging.error(f"Generated scenario didn't match the schema, using fallback scenario: {e}")
+            return self.get_fallback_scenario()
         except Exception as e:
             logging.error(f"Error generating scenario: {e}")
             return self.get_fallback_scenario()
 
+    @staticmethod
+    def _describe(scenario: ScenarioSpec) -> tuple[str, str, str]:
+        """Combine a scenario's parts into generate_scenario's return value.
+        
+        Args:
+            scenario (ScenarioSpec): The generated scenario
+            
+        Returns:
+            tuple[str, str, str]: scenario_description, character_context and user_role
+        """
+        scenario_description = (
+            f"{scenario.setting}. "
+            f"{scenario.situation} "
+            f"{scenario.atmosphere}\n\n"
+            f"Your role: {scenario.user_role}"
+        )
+        
+        return (
+            scenario_description,
+            scenario.character_context,
+            scenario.user_role
+        )
+
     def get_fallback_scenario(self) -> tuple[str, str, str]:
         """Get a predefined fallback scenario when generation fails.
         
@@ -83,18 +118,4 @@ class ScenarioGenerator:
                 - character_context: Context about expected character types
                 - user_role: The user's specific role in the scenario
         """
-        scenarios = [
-            ("A mysterious tavern on a stormy night. Travelers from different walks of life have sought shelter here, each carrying their own secrets and stories. The atmosphere is tense with unspoken tales and hidden agendas.",
-             "Travelers, innkeeper, mysterious stranger",
-             "A curious traveler seeking shelter from the storm"),
-            
-            ("An abandoned mansion during a masquerade ball. The guests are trapped inside by a mysterious force, and everyone seems to have a hidden agenda. The air is thick with intrigue and suspicion.",
-             "Noble guests, servants, mysterious host",
-             "An invited guest at the masquerade"),
-            
-            ("A futuristic space station at the edge of known space. The station's systems are malfunctioning, and the diverse crew members each seem to know more than they're letting on. The metallic corridors echo with whispered conspiracies.",
-             "Station crew, engineers, security personnel",
-             "A newly arrived passenger with vital information")
-        ]
-        
-        return random.choice(scenarios)
\ No newline at end of file
+        return self._rng.choice(_FALLBACK_SCENARIOS)
\ No newline at end of file
@@ -1,12 +1,24 @@
-import os
 import random
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import asdict
+from itertools import chain
 from langchain_groq import ChatGroq
-from typing import Dict, Optional, Generator
+from typing import Callable, Dict, Optional, Generator, Tuple, Union
 
-from .agents import Character, Narrator, Orchestrator, ResponseProcessor, GameLog
+from .agents import Character, Narrator, Orchestrator, ResponseProcessor, ResponseStream, BufferedGameLog
+from .agents.llm_pool import get_llm
+from .cache import LRUCache
 from .generator import ScenarioGenerator, CharacterGenerator
 from .schema import PlayConfig
 
+# Whitespace and quote characters trimmed from both ends of user input
+_INPUT_STRIP_CHARS = " \t\n\r\"'"
+# Endings that leave a line open for the user to answer
+_OPEN_ENDINGS = ("?", "...")
+# Closing quotes and trailing *actions* that can follow a line's last spoken words
+_TRAILING_DECORATION = re.compile(r'(?:\s*(?:\*[^*]*\*|["”]))+\s*$')
+
 class PlayManager:
     """Manages the interactive play experience including characters, narration and orchestration.
     
@@ -24,6 +36,8 @@ class PlayManager:
         response_processor (Optional[ResponseProcessor]): Processor for formatting character responses
         character_context (str): Additional context about expected characters in the scene
         user_role (str): The specific role/position assigned to the user in the scenario
+        response_cache (LRUCache): The play's cache of narrator responses, cleared
+            when a new play starts
         
     The PlayManager serves as the central coordinator, initializing and managing all the components
     needed for the interactive play experience. It handles:
@@ -52,8 +66,12 @@ class PlayManager:
         6. Prepares for orchestrator and response processor
         """
         self.config = config or PlayConfig()
-        self.narrator = Narrator()
+        # Narrator responses are only reused within this play manager, never across sessions
+        self.response_cache = LRUCache(self.config.response_cache_size)
+        self.narrator = Narrator(response_cache=self.response_cache)
         self.characters: Dict[str, Character] = {}
+        self._character_names: Tuple[str, ...] = ()
+        self._other_characters: Dict[str, Tuple[str, ...]] = {}
         self.user_name = self.config.default_user_name
         self.user_description = self.config.default_user_description
         self.orchestrator: Optional[Orchestrator] = None
@@ -61,32 +79,29 @@ class PlayManager:
         self.response_processor: Optional[ResponseProcessor] = None
         self.character_context: str = ""
         self.user_role: str = ""
+        self._rng = random.Random(self.config.seed)
         
         # Add game_log initialization
-        self.game_log = GameLog()
+        self.game_log = BufferedGameLog()
         
         # Initialize generators
         self.character_generator = CharacterGenerator(self.llm)
-        self.scenario_generator = ScenarioGenerator(self.llm)
+        self.scenario_generator = ScenarioGenerator(self.llm, rng=self._rng)
     
     def _initialize_llm(self) -> ChatGroq:
-        """Initialize and configure the language model instance.
+        """Get the language model instance.
         
-        Creates a new ChatGroq instance with appropriate configuration settings from environment
-        variables. Sets up the model with specified temperature for content generation.
+        Returns the shared "balanced" tier ChatGroq instance, which caps output
+        and requests JSON mode, configured from environment variables.
         
         Returns:
             ChatGroq: Configured language model instance ready for use
             
-        The method uses environment variables:
+        The model uses environment variables:
         - GROQ_API_KEY: API key for authentication
         - SCENARIO_MODEL: Name of the model to use
         """
-        return ChatGroq(
-            api_key=os.getenv("GROQ_API_KEY"),
-            model_name=os.getenv("SCENARIO_MODEL"),
-            temperature=0.5
-        )
+        return get_llm("balanced")
     
     def generate_characters(self, scene_description: str, num_characters: int = 3) -> None:
         """Generate character set based on the scene description.
@@ -100,6 +115,7 @@ class PlayManager:
             
         Side Effects:
             - Populates self.characters with generated Character instances
+            - Caches the character names, and everyone else's names per character
             - Prints status messages about character generation
             - Falls back to default characters if generation fails
             
@@ -116,6 +132,12 @@ class PlayManager:
             self.user_description,
             num_characters
         )
+        # The cast is fixed for the play, so the names are computed once
+        self._character_names = tuple(self.characters)
+        self._other_characters = {
+            name: tuple(other for other in self._character_names if other != name)
+            for name in self._character_names
+        }
     
     def generate_scenario(self) -> str:
         """Generate a random scenario for the interactive play.
@@ -142,7 +164,8 @@ class PlayManager:
         return scenario_description
     
     def start_play(self, scene_description: str, num_characters: Optional[int] = None, 
-                   user_name: Optional[str] = None, user_description: Optional[str] = None) -> str:
+                   user_name: Optional[str] = None, user_description: Optional[str] = None,
+                   input_provider: Callable[[str], str] = input) -> str:
         """Initialize and start the interactive play experience.
         
         Sets up all necessary components and begins the interactive play session
@@ -153,6 +176,8 @@ class PlayManager:
             num_characters (Optional[int]): Number of characters to generate
             user_name (Optional[str]): Name for the user's character
             user_description (Optional[str]): Description of the user's character
+            input_provider (Callable[[str], str]): Called with a prompt to ask for a scene
+                description when none is given. Defaults to the built-in input()
             
         Returns:
             str: Opening narration and ready message
@@ -176,15 +201,20 @@ class PlayManager:
         num_characters = num_characters or self.config.default_num_characters
         
         if not scene_description:
-            scene_description = input("Describe the scene and situation for the play: ")
+            scene_description = input_provider("Describe the scene and situation for the play: ")
+        
+        # Cached responses belong to the previous cast and scene
+        self.response_cache.clear()
 
         # Generate characters with updated user info
         self.generate_characters(scene_description, num_characters)
-        self.orchestrator = Orchestrator(self.characters, self.narrator, self.game_log)
+        self.orchestrator = Orchestrator(
+            self.characters, self.narrator, self.game_log, rng=self._rng
+        )
         
         # Log characters after generation
         for name, char in self.characters.items():
-            self.game_log.add_character(name, char.config.__dict__)
+            self.game_log.add_character(name, asdict(char.config))
         
         # Log the scene and narrator information
         self.game_log.log_event("narrator_setup", {
@@ -193,7 +223,7 @@ class PlayManager:
         })
         self.game_log.set_scene(scene_description)
         
-        self.response_processor = ResponseProcessor(self.characters, self.narrator)
+        self.response_processor = ResponseProcessor(self.characters, self.narrator, rng=self._rng)
         
         # Set user info for each character
         for char in self.characters.values():
@@ -210,7 +240,7 @@ class PlayManager:
         
         return f"{opening}\n\nThe scene is set. You may begin interacting..."
     
-    def process_input(self, user_input: str) -> Generator[str, None, None]:
+    def process_input(self, user_input: str) -> Generator[Union[str, ResponseStream], None, None]:
         """Process user input and generate character responses.
         
         Handles user input by determining appropriate character responses,
@@ -220,7 +250,9 @@ class PlayManager:
             user_input (str): The user's input text
             
         Yields:
-            str: Character responses, reactions, and follow-up messages
+            Union[str, ResponseStream]: Character responses, reactions, and follow-up
+                messages. The primary response is yielded as a ResponseStream, as are
+                the closing user prompt and any narrator observation
             
         Raises:
             RuntimeError: If play hasn't been properly started
@@ -229,7 +261,7 @@ class PlayManager:
         1. Validates play state
         2. Formats user input
         3. Determines next speaker
-        4. Generates primary response
+        4. Streams primary response
         5. Processes reactions from other characters
         6. Updates conversation history
         """
@@ -237,7 +269,7 @@ class PlayManager:
             raise RuntimeError("Play must be started before processing input")
             
         # Ensure input is wrapped in quotes, but avoid double-wrapping
-        cleaned_input = user_input.strip().strip("\"\'")
+        cleaned_input = user_input.strip(_INPUT_STRIP_CHARS)
         formatted_input = f'"{cleaned_input}"'
         
         # Get next speaker and target
@@ -246,31 +278,39 @@ class PlayManager:
         )
         
         if next_speaker not in self.characters:
-            next_speaker = random.choice(list(self.characters.keys()))
+            next_speaker = self._rng.choice(self._character_names)
             target = "User"
         
-        # Primary character response
-        char_response = self.characters[next_speaker].respond_to(
-            formatted_input,
-            target,
-            {"scene": self.narrator.current_scene}
+        # Stream the primary response so the UI can render it as it arrives
+        stream = self.response_processor.create_stream(
+            next_speaker,
+            self.characters[next_speaker].respond_to_stream(
+                formatted_input,
+                target,
+                self.orchestrator.build_response_context(next_speaker, formatted_input)
+            )
         )
-        
-        # Process primary response
-        yield from self.response_processor.process_response(next_speaker, target, char_response)
+        yield from self.response_processor.process_stream(next_speaker, target, stream)
+        char_response = stream.content
         
         # Update conversation history
         self.orchestrator._update_conversation_history(next_speaker, target, char_response)
         
         # Handle reactions
-        yield from self._process_reactions(next_speaker, char_response)
+        yield from self._process_reactions(next_speaker, target, char_response)
+        
+        # Any batched narration still running in the background closes the turn
+        yield from self.response_processor.flush_narrations()
         
-        # If narrator provides any observations
-        if narrator_observation := self.narrator.get_observation():
-            self._log_narrator_event("observation", narrator_observation)
-            yield narrator_observation
+        # If narrator provides any observations, stream them once the first text arrives
+        observation = self.narrator.get_observation_stream()
+        if (first_delta := next(observation, None)) is not None:
+            narrator_stream = ResponseStream("Narrator", chain([first_delta], observation))
+            yield narrator_stream
+            self._log_narrator_event("observation", narrator_stream.content)
     
-    def _process_reactions(self, primary_speaker: str, primary_response: str) -> Generator[str, None, None]:
+    def _process_reactions(self, primary_speaker: str, primary_target: str,
+                           primary_response: str) -> Generator[Union[str, ResponseStream], None, None]:
         """Process reactions from other characters to maintain engagement.
         
         Generates and manages reactions from other characters to the primary speaker's
@@ -278,78 +318,94 @@ class PlayManager:
         
         Args:
             primary_speaker (str): Name of the character who gave initial response
+            primary_target (str): Who the initial response was addressed to
             primary_response (str): Content of the initial response
             
         Yields:
-            str: Character reactions, follow-up responses, and user prompts
+            Union[str, ResponseStream]: Character reactions and follow-up responses,
+                then the streamed user prompt
             
         Side Effects:
             Updates conversation history in orchestrator
             
         The reaction process:
         1. Selects random subset of characters to react
-        2. Generates and processes their reactions
-        3. Occasionally generates follow-up interactions
-        4. Ensures user engagement through character prompts
+        2. Generates their reactions concurrently and processes them in completion order
+        3. Occasionally starts follow-up interactions alongside the remaining reactions
+        4. Ensures user engagement through a streamed character prompt, unless the
+           turn already ended on an open question to the user
         """
-        remaining_chars = [name for name in self.characters.keys() if name != primary_speaker]
-        num_reactions = min(len(remaining_chars), random.randint(1, 2))
-        
-        for char_name in random.sample(remaining_chars, num_reactions):
-            reaction = self.characters[char_name].respond_to(
-                primary_response,
-                primary_speaker,
-                {"scene": self.narrator.current_scene}
+        remaining_chars = self._other_characters.get(primary_speaker, self._character_names)
+        num_reactions = min(len(remaining_chars), 1 + (self._rng.random() < 0.5))
+        # The scene doesn't change mid-turn, so every response shares one read-only context
+        scene_context = {"scene": self.narrator.current_scene}
+        
+        # Reactions and follow-ups are independent LLM calls, so generate them
+        # concurrently and handle each one as soon as it completes
+        pending: Dict[Future, Tuple[str, str, bool]] = {}
+        last_speaker, last_target, last_response = primary_speaker, primary_target, primary_response
+        for char_name in self._rng.sample(remaining_chars, num_reactions):
+            pending[self._submit_response(char_name, primary_speaker, primary_response, scene_context)] = (
+                char_name, primary_speaker, True
             )
-            
-            yield from self.response_processor.process_response(char_name, primary_speaker, reaction)
-            self.orchestrator._update_conversation_history(char_name, primary_speaker, reaction)
-            
-            if random.random() < 0.2:
-                yield from self._process_followup(primary_speaker, char_name, reaction)
         
-        # After all reactions, have a character prompt the user
-        prompt_char = random.choice(list(self.characters.keys()))
-        prompt_response = self.characters[prompt_char].respond_to(
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                speaker, target, is_reaction = pending.pop(future)
+                response = future.result()
+                
+                yield from self.response_processor.process_response(speaker, target, response)
+                self.orchestrator._update_conversation_history(speaker, target, response)
+                last_speaker, last_target, last_response = speaker, target, response
+                
+                # The primary speaker occasionally follows up on a reaction
+                if is_reaction and self._rng.random() < 0.2:
+                    pending[self._submit_response(primary_speaker, speaker, response, scene_context)] = (
+                        primary_speaker, speaker, False
+                    )
+        
+        # A turn that already ends on an open question to the user hands them the
+        # floor without another LLM call
+        if (last_target == "User"
+                and _TRAILING_DECORATION.sub("", last_response).endswith(_OPEN_ENDINGS)):
+            prompt_response = f"[{last_speaker}]: *looks at you expectantly*"
+            yield prompt_response
+            self.orchestrator._update_conversation_history(last_speaker, "User", prompt_response)
+            return
+        
+        # Otherwise have a character prompt the user. Nothing is left to overlap
+        # with this call, so stream it to cut the wait for its first words
+        prompt_char = self._rng.choice(self._character_names)
+        prompt_stream = ResponseStream(prompt_char, self.characters[prompt_char].respond_to_stream(
             "prompt_user",  # Special signal
             "User",
-            {"scene": self.narrator.current_scene}
-        )
+            scene_context
+        ))
         
-        yield prompt_response  # Make sure we're yielding the prompt
+        yield prompt_stream  # Make sure we're yielding the prompt
+        prompt_response = prompt_stream.content
         self.orchestrator._update_conversation_history(prompt_char, "User", prompt_response)
         
-    def _process_followup(self, speaker: str, target: str, 
-                          previous_response: str) -> Generator[str, None, None]:
-        """Process follow-up responses between characters.
-        
-        Generates and handles follow-up interactions between characters to create
-        more natural conversation flow and deeper character interactions.
+    def _submit_response(self, speaker: str, target: str, message: str,
+                         context: Dict[str, str]) -> Future:
+        """Start generating a character's response on the orchestrator's thread pool.
         
         Args:
-            speaker (str): Name of the character speaking
+            speaker (str): Name of the character responding
             target (str): Name of the character being addressed
-            previous_response (str): The response being followed up on
+            message (str): The message being responded to
+            context (Dict[str, str]): Scene context shared by the turn's responses
             
-        Yields:
-            str: Follow-up responses from characters
-            
-        Side Effects:
-            Updates conversation history in orchestrator
-            
-        The follow-up process:
-        1. Generates appropriate follow-up response
-        2. Processes the response through response processor
-        3. Updates conversation history
+        Returns:
+            Future: Future resolving to the character's formatted response
         """
-        follow_up = self.characters[speaker].respond_to(
-            previous_response,
+        return self.orchestrator.executor.submit(
+            self.characters[speaker].respond_to,
+            message,
             target,
-            {"scene": self.narrator.current_scene}
+            context
         )
-        
-        yield from self.response_processor.process_response(speaker, target, follow_up)
-        self.orchestrator._update_conversation_history(speaker, target, follow_up)
     
     def cleanup(self) -> None:
         """Clean up resources when shutting down the play manager.
@@ -358,15 +414,26 @@ class PlayManager:
         ensuring proper resource management.
         
         Side Effects:
-            Shuts down the orchestrator's thread pool executor if it exists
+            - Stops the thought generation thread
+            - Shuts down the orchestrator's thread pool and the narration worker if started
+            - Clears the play's cached LLM responses
+            - Writes any queued game log events and stops the log writer thread
             
         The cleanup process:
         1. Checks for active orchestrator
         2. Shuts down thread pool executor if present
-        3. Ensures proper resource release
+        3. Flushes and closes the game log
+        4. Ensures proper resource release
         """
         if self.orchestrator:
-            self.orchestrator.executor.shutdown()
+            # Stop generating thoughts first, so the thread stops logging before the log closes
+            self.orchestrator.thought_manager.stop()
+            if self.orchestrator._executor is not None:
+                self.orchestrator.executor.shutdown()
+        if self.response_processor:
+            self.response_processor.shutdown()
+        self.response_cache.clear()
+        self.game_log.close()
     
     def _log_narrator_event(self, event_type: str, content: str) -> None:
         """Log narrator events to the game log.
@@ -1,9 +1,11 @@
 from .config import CharacterConfig, PlayConfig, FlowConfig, OrchestratorConfig
-from .event import SceneEvent, ConversationEvent, MemoryEvent
+from .event import SceneEvent, ConversationEvent, MemoryEvent, LogEntry
 from .enum import EventType, SpeakerType
+from .spec import CharacterSpec, CharacterList, ScenarioSpec
 
 __all__ = [
     "CharacterConfig", "PlayConfig", "FlowConfig", "OrchestratorConfig",
-    "SceneEvent", "ConversationEvent", "MemoryEvent", 
+    "CharacterSpec", "CharacterList", "ScenarioSpec",
+    "SceneEvent", "ConversationEvent", "MemoryEvent", "LogEntry",
     "EventType", "SpeakerType"
 ]
\ No newline at end of file
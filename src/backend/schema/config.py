@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Optional
 
-@dataclass
+@dataclass(slots=True)
 class CharacterConfig:
     """Configuration class for character attributes.
     
@@ -26,7 +26,7 @@ class CharacterConfig:
     role_in_scene: str = ""
     relation_to_user: str = ""
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayConfig:
     """Configuration class for interactive play settings and defaults.
     
@@ -34,22 +34,18 @@ class PlayConfig:
         default_num_characters: Default number of characters to include in a scene
         default_user_name: Default name for users who don't provide one
         default_user_description: Default description for users who don't provide one
-        fallback_scenarios: List of pre-written scenario descriptions used when 
-            custom scenarios are not provided
         max_memories: Maximum number of memories to keep
+        response_cache_size: Maximum number of narrator responses cached per play
+        seed: Seed for the play's random choices, for reproducible runs. None seeds from the OS
     """
     default_num_characters: int = 4
     default_user_name: str = "Anonymous Player"
     default_user_description: str = "A curious participant in this interactive story"
     max_memories: int = 10
-    
-    fallback_scenarios: List[str] = (
-        "A mysterious tavern on a stormy night. Travelers from different walks of life have sought shelter here, each carrying their own secrets and stories. The atmosphere is tense with unspoken tales and hidden agendas.",
-        "An abandoned mansion during a masquerade ball. The guests are trapped inside by a mysterious force, and everyone seems to have a hidden agenda. The air is thick with intrigue and suspicion.",
-        "A futuristic space station at the edge of known space. The station's systems are malfunctioning, and the diverse crew members each seem to know more than they're letting on. The metallic corridors echo with whispered conspiracies."
-    )
+    response_cache_size: int = 512
+    seed: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FlowConfig:
     """Configuration for conversation flow parameters."""
     idle_time_threshold: int = 45  # seconds before characters initiate
@@ -57,8 +53,11 @@ class FlowConfig:
     user_response_chance: float = 0.9  # 90% chance to wait for user after question
     direct_response_chance: float = 0.9  # 90% chance to respond when directly addressed
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrchestratorConfig:
     """Configuration for the orchestrator."""
     max_history_length: int = 10
-    thought_queue_multiplier: int = 2 
\ No newline at end of file
+    thought_queue_multiplier: int = 2
+    max_concurrent_responses: int = 4  # worker cap; the LLM backend is the real bottleneck
+    thought_cache_size: int = 256  # thoughts kept per unchanged character/scene/history state
+    thought_cache_bypass_chance: float = 0.1  # 10% chance to regenerate anyway, for variety 
\ No newline at end of file
@@ -1,10 +1,11 @@
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional
 
 from .enum import EventType
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SceneEvent:
     """Represents a narrative event in the scene history.
     
@@ -15,7 +16,7 @@ class SceneEvent:
     description: str
     type: EventType
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationEvent:
     """Represents a single conversation interaction between characters.
     
@@ -24,13 +25,24 @@ class ConversationEvent:
         target (str): The name of the character being spoken to 
         message (str): The content of the message
         timestamp (float): Unix timestamp of when the message was sent
+        target_lower (str): Lowercased target, computed once for flow checks
+        is_user_target (bool): Whether the message is addressed to the user, in any casing
     """
     speaker: str
     target: str 
     message: str
-    timestamp: float = time.time()
+    timestamp: float = field(default_factory=time.time)
+    target_lower: str = field(init=False, repr=False, compare=False)
+    is_user_target: bool = field(init=False, repr=False, compare=False)
     
-@dataclass
+    def __post_init__(self) -> None:
+        """Precompute the normalized target."""
+        # Frozen dataclasses have to bypass their own __setattr__ to fill derived fields
+        target_lower = self.target.lower()
+        object.__setattr__(self, "target_lower", target_lower)
+        object.__setattr__(self, "is_user_target", target_lower == "user")
+    
+@dataclass(slots=True, frozen=True)
 class MemoryEvent:
     """Represents a single memory event containing a conversation interaction."""
     speaker: str
@@ -40,4 +52,31 @@ class MemoryEvent:
     
     def __str__(self) -> str:
         """String representation of the memory event."""
-        return f"{self.speaker}: {self.message} -> {self.response}"
\ No newline at end of file
+        return f"{self.speaker}: {self.message} -> {self.response}"
+
+class LogEntry(NamedTuple):
+    """A game log event waiting to be written to the log file.
+    
+    Kept as a tuple until it is written, so logging an event doesn't format the
+    timestamp or build the merged dictionary stored in the log.
+    
+    Attributes:
+        timestamp: Unix time the event was logged at
+        type: Category of event (e.g., "dialogue", "action")
+        data: Event-specific data to be logged
+    """
+    timestamp: float
+    type: str
+    data: Dict[str, Any]
+    
+    def as_record(self) -> Dict[str, Any]:
+        """Build the entry as stored in the log's events list.
+        
+        Returns:
+            Dict[str, Any]: The ISO timestamp and type merged with the event data
+        """
+        return {
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "type": self.type,
+            **self.data
+        }
@@ -0,0 +1,56 @@
+from pydantic import BaseModel, field_validator
+from typing import Any, Dict, List, Literal
+
+class CharacterSpec(BaseModel):
+    """Structured output schema for a single generated character.
+    
+    Attributes:
+        name: Character's name
+        gender: Character's gender, one of "male", "female" or "non-binary"
+        description: Character's physical description
+        personality: Dictionary of personality traits and values between 0 and 1
+        background: Character's background story
+        hidden_motive: Character's secret motivation
+        emoji: Emoji representation of the character
+        role_in_scene: Character's role in the scenario
+        relation_to_user: Character's relation to the user
+    """
+    name: str
+    gender: Literal["male", "female", "non-binary"] = "non-binary"
+    description: str = ""
+    personality: Dict[str, float]
+    background: str
+    hidden_motive: str
+    emoji: str = "👤"
+    role_in_scene: str = ""
+    relation_to_user: str = ""
+    
+    @field_validator("gender", mode="before")
+    @classmethod
+    def _normalize_gender(cls, value: Any) -> Any:
+        """Accept gender values regardless of case or surrounding whitespace."""
+        return value.strip().lower() if isinstance(value, str) else value
+
+class CharacterList(BaseModel):
+    """Structured output schema for a generated set of characters.
+    
+    Attributes:
+        characters: The generated characters
+    """
+    characters: List[CharacterSpec]
+
+class ScenarioSpec(BaseModel):
+    """Structured output schema for a generated scenario.
+    
+    Attributes:
+        setting: Description of the location
+        situation: Description of what's happening
+        atmosphere: Description of mood and environment
+        user_role: Suggested role or position for the user character
+        character_context: Brief description of the types of characters in the scenario
+    """
+    setting: str
+    situation: str
+    atmosphere: str
+    user_role: str
+    character_context: str = ""
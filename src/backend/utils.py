@@ -1,7 +1,57 @@
-import json
-import streamlit as st
+import logging
+import orjson
 from typing import Optional, Dict, Any
 
+# Maps curly double quotes and plain single quotes to straight double quotes. Curly
+# single quotes become apostrophes, so contractions like don’t stay inside their string
+_QUOTE_TABLE = str.maketrans({
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "'": '"'
+})
+
+def strip_code_fence(response_text: str) -> str:
+    """Strip a surrounding markdown code fence (e.g. ```json ... ```) from a response.
+    
+    Args:
+        response_text: Raw response text that may be wrapped in a code fence
+        
+    Returns:
+        The fenced body if a fence is present, otherwise the original text
+    """
+    _, fence, rest = response_text.partition("```")
+    if not fence:
+        return response_text
+    
+    # Drop the language tag line (```json) if the body doesn't start right away
+    if not rest.lstrip().startswith(("{", "[")):
+        _, _, rest = rest.partition("\n")
+    
+    body, _, _ = rest.partition("```")
+    return body.strip()
+
+def _json_span(response_text: str) -> Optional[str]:
+    """Find the outermost JSON object or array in a response that may be wrapped in prose.
+    
+    Args:
+        response_text: Response text such as "Here's the JSON: {...}"
+        
+    Returns:
+        The text from the first opening bracket to its last matching closing bracket,
+        or None if there's no such span
+    """
+    starts = [index for index in (response_text.find("{"), response_text.find("[")) if index >= 0]
+    if not starts:
+        return None
+    
+    start = min(starts)
+    end = response_text.rfind("}" if response_text[start] == "{" else "]")
+    if end <= start:
+        return None
+    return response_text[start:end + 1]
+
 def clean_json_response(response_text: str) -> Optional[Dict[str, Any]]:
     """Clean and validate JSON response by handling common formatting issues.
     
@@ -19,24 +69,27 @@ def clean_json_response(response_text: str) -> Optional[Dict[str, Any]]:
         >>> clean_json_response("Invalid JSON")
         None
     """
+    response_text = strip_code_fence(response_text)
+    
     try:
         # First try direct JSON parsing
-        return json.loads(response_text)
-    except json.JSONDecodeError:
+        return orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        # Drop any prose around the payload before touching the quotes
+        span = _json_span(response_text)
+        if span is not None and span != response_text:
+            try:
+                return orjson.loads(span)
+            except orjson.JSONDecodeError:
+                pass
+        
         try:
-            # Try to clean up common JSON formatting issues
-            # Remove any leading/trailing whitespace
-            cleaned = response_text.strip()
-            
-            # Ensure proper quote usage
-            cleaned = cleaned.replace('"', '"').replace('"', '"')
-            
-            # Replace any single quotes with double quotes for JSON compatibility
-            cleaned = cleaned.replace("'", '"')
+            # Strip whitespace and normalize curly and single quotes in one pass
+            cleaned = (span or response_text).strip().translate(_QUOTE_TABLE)
             
             # Try parsing again
-            return json.loads(cleaned)
-        except json.JSONDecodeError as e:
-            st.error(f"Failed to parse character data: {str(e)}")
-            st.code(response_text)  # Display the problematic response for debugging
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError as e:
+            # Runs on worker threads too, so failures are logged rather than shown in the UI
+            logging.error(f"Failed to parse JSON response: {e}\n{response_text}")
             return None
\ No newline at end of file
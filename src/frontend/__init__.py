@@ -1,4 +1,7 @@
-from .message_display import display_message, get_avatar_emoji, extract_character_name
+from .message_display import (
+    display_message, display_formatted_message, display_history, display_stream, format_message, add_message,
+    get_avatar_emoji, extract_character_name
+)
 from .sidebar import display_sidebar
 from .styles import apply_custom_styles
 from .user_setup import display_user_setup
@@ -7,6 +10,11 @@ from .config import setup_page_config
 
 __all__ = [
     'display_message',
+    'display_formatted_message',
+    'display_history',
+    'display_stream',
+    'format_message',
+    'add_message',
     'get_avatar_emoji',
     'extract_character_name',
     'display_sidebar',
@@ -1,6 +1,10 @@
+import html
 import streamlit as st
 import re
-from typing import Optional
+from typing import Iterable, Optional, Sequence, Tuple
+
+# Matches the "[Character Name]:" prefix of character messages
+_CHARACTER_PREFIX_RE = re.compile(r'\[([^\]]+)\]:')
 
 def extract_character_name(message: str) -> Optional[str]:
     """Extract character name from message if it starts with [Character Name]:
@@ -11,11 +15,33 @@ def extract_character_name(message: str) -> Optional[str]:
     Returns:
         Optional[str]: The extracted character name if found, None otherwise
     """
-    match = re.match(r'\[(.*?)\]:', message)
+    if not message.startswith('['):
+        return None
+    
+    match = _CHARACTER_PREFIX_RE.match(message)
     if match:
         return match.group(1)
     return None
 
+def _parse_character_message(content: str) -> Tuple[Optional[str], str]:
+    """Split a message into its character name and body with a single regex match.
+    
+    Args:
+        content (str): The raw message content
+        
+    Returns:
+        Tuple[Optional[str], str]: The character name (None if the message has no
+            "[Character Name]:" prefix) and the message body
+    """
+    # User turns and plain narration can't carry a prefix; skip the regex for them
+    if not content.startswith('['):
+        return None, content
+    
+    match = _CHARACTER_PREFIX_RE.match(content)
+    if match:
+        return match.group(1), content[match.end():].strip()
+    return None, content
+
 def get_avatar_emoji(character_name: Optional[str]) -> str:
     """Return an emoji avatar based on character name or stored emoji.
     
@@ -27,6 +53,7 @@ def get_avatar_emoji(character_name: Optional[str]) -> str:
     
     The function checks for special cases like Narrator and user (None),
     then looks up character-specific emojis from the play manager if available.
+    Emojis resolved for known characters are cached in session state.
     Falls back to a default avatar if no specific emoji is found.
     """
     if character_name == "Narrator":
@@ -34,13 +61,125 @@ def get_avatar_emoji(character_name: Optional[str]) -> str:
     elif not character_name:
         return "🧑"  # Default for user
     
+    avatar_cache = st.session_state.avatar_cache
+    if character_name in avatar_cache:
+        return avatar_cache[character_name]
+    
     # Use character's assigned emoji if available
-    if hasattr(st.session_state, 'play_manager') and character_name in st.session_state.play_manager.characters:
-        char = st.session_state.play_manager.characters[character_name]
-        if hasattr(char.config, 'emoji') and char.config.emoji:
-            return char.config.emoji
+    play_manager = st.session_state.get('play_manager')
+    char = play_manager.characters.get(character_name) if play_manager is not None else None
+    if char is None:
+        return "👤"
     
-    return "👤"
+    emoji = getattr(char.config, 'emoji', None) or "👤"
+    avatar_cache[character_name] = emoji
+    return emoji
+
+@st.cache_data(show_spinner=False)
+def _format_message_body(role: str, content: str) -> Tuple[Optional[str], str]:
+    """Parse a message and build its markdown, memoized on (role, content).
+    
+    The avatar is resolved separately since it depends on the session's characters.
+    User and LLM text is HTML-escaped, so the markdown can be rendered with
+    unsafe_allow_html=True without letting messages inject their own markup.
+    
+    Args:
+        role (str): The role of the message sender ('user' or 'assistant')
+        content (str): The raw message content
+        
+    Returns:
+        Tuple[Optional[str], str]: The character name (None for non-character
+            messages) and the markdown to render
+    """
+    character_name, message_content = _parse_character_message(content)
+    
+    if character_name:
+        return character_name, (
+            f"**{html.escape(character_name, quote=False)}**<br>"
+            f"{html.escape(message_content, quote=False)}"
+        )
+    return None, html.escape(content, quote=False)
+
+def format_message(role: str, content: str) -> Tuple[str, str]:
+    """Resolve the avatar and markdown used to display a message.
+    
+    Args:
+        role (str): The role of the message sender ('user' or 'assistant')
+        content (str): The raw message content
+        
+    Returns:
+        Tuple[str, str]: The avatar emoji and the markdown to render
+        
+    Character messages in format "[Character Name]: message" get the character's
+    avatar and a bold name header; other messages are only HTML-escaped.
+    """
+    character_name, markdown = _format_message_body(role, content)
+    
+    if character_name:
+        return get_avatar_emoji(character_name), markdown
+    return "🧑" if role == "user" else "🤖", markdown
+
+def add_message(role: str, content: str) -> Tuple[str, str]:
+    """Format a message once and append it to the session's message history.
+    
+    The history is stored as parallel lists (msg_roles, msg_avatars, msg_html)
+    so reruns can replay it without re-parsing every message.
+    
+    Args:
+        role (str): The role of the message sender ('user' or 'assistant')
+        content (str): The raw message content
+        
+    Returns:
+        Tuple[str, str]: The avatar emoji and the markdown to render
+    """
+    avatar, markdown = format_message(role, content)
+    st.session_state.msg_roles.append(role)
+    st.session_state.msg_avatars.append(avatar)
+    st.session_state.msg_html.append(markdown)
+    return avatar, markdown
+
+def display_formatted_message(role: str, avatar: str, markdown: str) -> None:
+    """Display an already formatted message in a chat bubble.
+    
+    Args:
+        role (str): The role of the message sender ('user' or 'assistant')
+        avatar (str): The avatar emoji to show next to the message
+        markdown (str): The formatted message markdown
+    """
+    st.chat_message(role, avatar=avatar).markdown(markdown, unsafe_allow_html=True)
+
+def display_history(messages: Sequence[Tuple[str, str, str]]) -> None:
+    """Display already formatted messages as a single HTML block.
+    
+    Replaying history through one st.markdown call avoids opening a
+    st.chat_message container per message on every rerun. Since all messages
+    share one HTML block, each body must already be escaped, as format_message's
+    markdown is, so a stray tag in one message can't break the others.
+    
+    Args:
+        messages (Sequence[Tuple[str, str, str]]): (role, avatar, markdown) triples,
+            with the markdown built by format_message
+    """
+    if not messages:
+        return
+    
+    # Blank lines around each body let Streamlit parse the markdown inside the divs
+    blocks = "\n".join(
+        f'<div class="msg {role}">\n\n<span class="avatar">{html.escape(avatar)}</span> {markdown}\n\n</div>'
+        for role, avatar, markdown in messages
+    )
+    st.markdown(f'<div class="chat-history">\n{blocks}\n</div>', unsafe_allow_html=True)
+
+def display_stream(stream: Iterable[str]) -> None:
+    """Display a character response in a chat bubble as it streams in.
+    
+    Args:
+        stream (Iterable[str]): The backend ResponseStream, which yields text deltas
+            and names the character in its `speaker` attribute
+    """
+    bubble = st.chat_message("assistant", avatar=get_avatar_emoji(stream.speaker))
+    bubble.markdown(f"**{stream.speaker}**")
+    bubble.write_stream(stream)
 
 def display_message(role: str, content: str) -> None:
     """Display message with character-specific styling in markdown format.
@@ -56,14 +195,4 @@ def display_message(role: str, content: str) -> None:
     Messages are displayed with appropriate avatars and formatting using
     Streamlit's chat message components.
     """
-    character_name = extract_character_name(content)
-    
-    if character_name:
-        message_content = content.split(":", 1)[1].strip()
-        
-        with st.chat_message(role, avatar=get_avatar_emoji(character_name)):
-            formatted_message = f"**{character_name}**<br>{message_content}"
-            st.markdown(formatted_message, unsafe_allow_html=True)
-    else:
-        with st.chat_message(role, avatar="🧑" if role == "user" else "🤖"):
-            st.markdown(content)
\ No newline at end of file
+    display_formatted_message(role, *format_message(role, content))
\ No newline at end of file
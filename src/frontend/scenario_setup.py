@@ -1,4 +1,5 @@
 import streamlit as st
+from .message_display import add_message
 
 def initialize_scenario(scene_description: str = None) -> None:
     """Initialize a new scenario with either random or custom scene description.
@@ -7,9 +8,16 @@ def initialize_scenario(scene_description: str = None) -> None:
         scene_description: Optional custom scenario description. If None, generates random.
     """
     try:
-        st.session_state.started = True
-        st.session_state.info_saved = False
-        st.session_state.messages = []
+        st.session_state.update({
+            'started': True,
+            'info_saved': False,
+            'msg_roles': [],
+            'msg_avatars': [],
+            'msg_html': [],
+            # Cached avatars and trait labels belong to the previous cast
+            'avatar_cache': {},
+            'trait_label_cache': {}
+        })
         
         play_manager = st.session_state.play_manager
         play_manager.user_name = st.session_state.user_name
@@ -30,11 +38,13 @@ def initialize_scenario(scene_description: str = None) -> None:
             user_name=st.session_state.user_name,
             user_description=st.session_state.user_description
         )
-        st.session_state.messages.append(("assistant", initial_response))
+        add_message("assistant", initial_response)
         
-        # Get initial character response
-        initial_char_response = play_manager.orchestrator.get_initial_character_response()
-        st.session_state.messages.append(("assistant", initial_char_response))
+        # Generate the initial character response in the background; display_chat
+        # collects it once the opening narration is on screen
+        st.session_state.pending_initial_response = play_manager.orchestrator.executor.submit(
+            play_manager.orchestrator.get_initial_character_response
+        )
         
     except Exception as e:
         st.error(f"Error generating scenario: {str(e)}")
@@ -1,6 +1,38 @@
 import streamlit as st
+from typing import Dict, List, Tuple
+
 from .message_display import get_avatar_emoji
 
+def _format_trait(trait: str) -> str:
+    """Turn a trait name like "quick_wit" into a display label like "Quick Wit".
+    
+    Args:
+        trait (str): The trait name as generated
+        
+    Returns:
+        str: The title-cased label
+    """
+    return ' '.join(word.capitalize() for word in trait.replace('_', ' ').split())
+
+def _trait_labels(char_name: str, personality: Dict[str, float]) -> List[Tuple[str, float]]:
+    """Get a character's personality traits with display-ready labels.
+    
+    Labels are built once per character and cached in session state.
+    
+    Args:
+        char_name (str): Name of the character the traits belong to
+        personality (Dict[str, float]): The character's trait names and values
+        
+    Returns:
+        List[Tuple[str, float]]: Title-cased trait labels paired with their values
+    """
+    trait_label_cache = st.session_state.trait_label_cache
+    if char_name not in trait_label_cache:
+        trait_label_cache[char_name] = [
+            (_format_trait(trait), value) for trait, value in personality.items()
+        ]
+    return trait_label_cache[char_name]
+
 def display_sidebar() -> None:
     """Display the sidebar with character information and scene context.
     
@@ -13,50 +45,76 @@ def display_sidebar() -> None:
         - Personality traits
         
     The sidebar uses expanders to organize character information and
-    custom styling for readable formatting.
+    custom styling for readable formatting. A character's details are only
+    rendered while their expander is open.
     
     Side Effects:
         Modifies the Streamlit sidebar by adding various UI elements
         including markdown text, expanders, and subheaders.
     """
+    # Fragments can't call st.sidebar themselves, so the fragment runs inside it
     with st.sidebar:
-        # Add Reset Play button at the top of sidebar
-        if st.button("Reset Play"):
-            st.session_state.play_manager.cleanup()
-            st.session_state.clear()
-            st.rerun()
-            
-        st.subheader("Characters in Scene")
-        
-        # Display user first
-        st.markdown(f"**{get_avatar_emoji(None)} {st.session_state.user_name}** (You)")
-        st.markdown(f"<small>{st.session_state.user_description}</small>", unsafe_allow_html=True)
+        _display_sidebar_contents()
+
+@st.fragment
+def _display_sidebar_contents() -> None:
+    """Render the sidebar's contents as a fragment.
+    
+    Interacting with the sidebar only reruns this function instead of the whole
+    app, so the chat transcript isn't redrawn. Resetting the play still reruns
+    the full app.
+    """
+    # Add Reset Play button at the top of sidebar
+    if st.button("Reset Play"):
+        st.session_state.play_manager.cleanup()
+        st.session_state.clear()
+        st.rerun(scope="app")
         
-        st.markdown("---")
+    st.subheader("Characters in Scene")
+    
+    # Display user first
+    st.markdown(
+        f"**{get_avatar_emoji(None)} {st.session_state.user_name}** (You)\n\n"
+        f"<small>{st.session_state.user_description}</small>",
+        unsafe_allow_html=True
+    )
+    
+    st.markdown("---")
+    
+    # Display scene context if available
+    scene_description = getattr(st.session_state.play_manager, 'scene_description', None)
+    if scene_description is not None:
+        with st.expander("Scene Context"):
+            st.markdown(f"<small>{scene_description}</small>", unsafe_allow_html=True)
+    
+    # Display all other characters
+    for char_name, char in st.session_state.play_manager.characters.items():
+        emoji = get_avatar_emoji(char_name)
+        expander = st.expander(
+            f"**{emoji} {char_name}**",
+            key=f"sidebar_character_{char_name}",
+            on_change="rerun"
+        )
+        # Collapsed expanders send nothing; opening one reruns the fragment to fill it
+        if not expander.open:
+            continue
         
-        # Display scene context if available
-        if hasattr(st.session_state.play_manager, 'scene_description'):
-            with st.expander("Scene Context"):
-                st.markdown(f"<small>{st.session_state.play_manager.scene_description}</small>", 
-                          unsafe_allow_html=True)
+        # Each field is its own paragraph, sent as a single markdown element
+        parts = []
+        description = getattr(char.config, 'description', None)
+        if description is not None:
+            parts.append(f"<small>**Description:** {description}</small>")
+        background = getattr(char.config, 'background', None)
+        if background is not None:
+            parts.append(f"<small>**Background:** {background}</small>")
+        personality = getattr(char.config, 'personality', None)
+        if personality is not None:
+            parts.append("<small>**Personality Traits:**</small>")
+            if isinstance(personality, dict):
+                parts.extend(
+                    f"<small>• {formatted_trait}: {value}</small>"
+                    for formatted_trait, value in _trait_labels(char_name, personality)
+                )
         
-        # Display all other characters
-        for char_name, char in st.session_state.play_manager.characters.items():
-            emoji = get_avatar_emoji(char_name)
-            with st.expander(f"**{emoji} {char_name}**"):
-                if hasattr(char.config, 'description'):
-                    st.markdown(f"<small>**Description:** {char.config.description}</small>", 
-                              unsafe_allow_html=True)
-                if hasattr(char.config, 'background'):
-                    st.markdown(f"<small>**Background:** {char.config.background}</small>", 
-                              unsafe_allow_html=True)
-                if hasattr(char.config, 'personality'):
-                    st.markdown("<small>**Personality Traits:**</small>", unsafe_allow_html=True)
-                    if isinstance(char.config.personality, dict):
-                        for trait, value in char.config.personality.items():
-                            formatted_trait = ' '.join(
-                                word.capitalize() 
-                                for word in trait.replace('_', ' ').split()
-                            )
-                            st.markdown(f"<small>• {formatted_trait}: {value}</small>", 
-                                      unsafe_allow_html=True)
\ No newline at end of file
+        with expander:
+            st.markdown("\n\n".join(parts), unsafe_allow_html=True)
\ No newline at end of file
@@ -1,27 +1,60 @@
 import streamlit as st
 
-def apply_custom_styles() -> None:
-    """Apply custom CSS styles to the application.
+@st.cache_resource(show_spinner=False)
+def _get_custom_styles() -> str:
+    """Build the custom CSS block once per server process.
     
-    Applies custom styling to:
-    - Chat messages: Adds bottom margin and adjusts paragraph spacing
-    - Sidebar character descriptions: Sets smaller, muted text style
-    
-    Side Effects:
-        Injects custom CSS into the Streamlit app using st.markdown()
+    Returns:
+        str: The <style> block injected by apply_custom_styles
     """
-    st.markdown("""
+    return """
         <style>
         .stChatMessage {
             margin-bottom: 1rem;
+            animation: fade-in 0.3s ease-in both;
+        }
+        @keyframes fade-in {
+            from { opacity: 0; }
+            to { opacity: 1; }
         }
         .stChatMessage .content p {
             margin-bottom: 0.2rem;
         }
+        /* Replayed history rendered as a single HTML block */
+        .chat-history .msg {
+            margin-bottom: 1rem;
+            padding: 0.5rem 0.75rem;
+            border-radius: 0.5rem;
+        }
+        .chat-history .msg.user {
+            background-color: rgba(240, 242, 246, 0.5);
+        }
+        .chat-history .msg p {
+            margin-bottom: 0.2rem;
+        }
+        .chat-history .avatar {
+            margin-right: 0.5rem;
+        }
         /* Add styling for character descriptions in sidebar */
         .sidebar small {
             color: #666;
             font-size: 0.85em;
         }
         </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """
+
+def apply_custom_styles() -> None:
+    """Apply custom CSS styles to the application.
+    
+    Applies custom styling to:
+    - Chat messages: Adds bottom margin, adjusts paragraph spacing and fades new messages in
+    - Chat history: Spaces and highlights messages replayed as a single HTML block
+    - Sidebar character descriptions: Sets smaller, muted text style
+    
+    The CSS block itself is built once and cached; the st.markdown() call has to
+    run on every rerun since Streamlit drops elements that aren't redrawn.
+    
+    Side Effects:
+        Injects custom CSS into the Streamlit app using st.markdown()
+    """
+    st.markdown(_get_custom_styles(), unsafe_allow_html=True)